@@ -14,7 +14,7 @@ class RabiExperiment(BaseAlgorithm):
         amps = np.linspace(0.0, 0.5, 5)
         results = []
         for amp in amps:
-            data = twin.simulator.simulate_schrodinger(trajectories=1)
+            data = twin.simulator.simulate_schrodinger(controls=np.array([[amp, 0.0, 0.0]]))
             results.append({"amp": amp, "rho": data["rho"]})
         self.logger.info("RabiExperiment completed with %d amplitudes", len(amps))
         return {"sweep": results}
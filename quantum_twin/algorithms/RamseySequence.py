@@ -14,7 +14,7 @@ class RamseySequence(BaseAlgorithm):
         detunings = np.linspace(-0.1, 0.1, 5)
         results = []
         for det in detunings:
-            data = twin.simulator.simulate_schrodinger(trajectories=1)
+            data = twin.simulator.simulate_schrodinger(controls=np.array([[0.0, 0.0, det]]))
             results.append({"detuning": det, "rho": data["rho"]})
         self.logger.info("RamseySequence completed with %d detunings", len(detunings))
         return {"sweep": results}
@@ -19,19 +19,20 @@ class OptimizerAPI(BaseComponent):
         self.logger.info("OptimizerAPI initialized %s", params)
 
     def estimate_parameters(self, data: Dict[str, Any]) -> Dict[str, float]:
-        estimator = ParameterEstimator(self._params.get("parameter_estimator", {}))
-        return estimator.run()
+        estimator = ParameterEstimator(**self._params.get("parameter_estimator", {}))
+        return estimator.run(data)
 
     def optimize_control(self, target_state: str | None = None, strategy: str = "gradient") -> List[float]:
         strategy = strategy.lower()
         if strategy == "uniform":
-            optimizer = UniformControlOptimizer(self._params.get("control_optimizer", {}))
+            optimizer = UniformControlOptimizer(**self._params.get("control_optimizer", {}))
         elif strategy == "gaussian":
-            optimizer = GaussianControlOptimizer(self._params.get("control_optimizer", {}))
+            optimizer = GaussianControlOptimizer(**self._params.get("control_optimizer", {}))
         else:
-            optimizer = GradientControlOptimizer(self._params.get("control_optimizer", {}))
+            optimizer = GradientControlOptimizer(**self._params.get("control_optimizer", {}))
+            return optimizer.run(target_state)
         return optimizer.run()
 
     def fit_surrogate(self, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        fitter = SurrogateFitter(params or self._params.get("surrogate_fitter", {}))
+        fitter = SurrogateFitter(**(params or self._params.get("surrogate_fitter", {})))
         return fitter.run()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import torch
+
+from quantum_twin.core.BaseComponent import BaseComponent
+
+
+class SimulationCache(BaseComponent):
+    """Two-tier content-addressed cache of simulation results.
+
+    Entries are keyed by ``SimulationCache.key`` of the physics parameters. Lookups try an in-memory LRU
+    first, then ``.pt`` files in ``directory`` (promoted to memory on hit). Both tiers evict least
+    recently used entries once their byte budget is exceeded; disk recency is tracked by file mtime.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_memory_bytes: int = 256 * 2**20,
+        max_disk_bytes: int = 2**30,
+    ) -> None:
+        super().__init__()
+        self._dir = Path(directory) if directory else None
+        if self._dir is not None:
+            self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_memory_bytes = int(max_memory_bytes)
+        self._max_disk_bytes = int(max_disk_bytes)
+        self._memory: OrderedDict[str, Dict[str, torch.Tensor]] = OrderedDict()
+        self._memory_bytes = 0
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self.logger.info(
+            "SimulationCache ready directory=%s memory=%d bytes disk=%d bytes",
+            self._dir,
+            self._max_memory_bytes,
+            self._max_disk_bytes,
+        )
+
+    @staticmethod
+    def _canonical(value: Any) -> Any:
+        if isinstance(value, torch.Tensor):
+            value = value.detach().cpu().numpy()
+        if isinstance(value, np.ndarray):
+            return {"shape": list(value.shape), "values": np.asarray(value, dtype=np.float64).ravel().tolist()}
+        if isinstance(value, (np.floating, np.integer, np.bool_)):
+            return value.item()
+        if isinstance(value, dict):
+            return {str(k): SimulationCache._canonical(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [SimulationCache._canonical(v) for v in value]
+        return value
+
+    @staticmethod
+    def key(physics: Dict[str, Any]) -> str:
+        """sha256 of the sorted-key JSON of ``physics``; floats keep their exact ``repr``."""
+        canonical = json.dumps(SimulationCache._canonical(physics), sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _nbytes(value: Dict[str, torch.Tensor]) -> int:
+        return sum(tensor.element_size() * tensor.numel() for tensor in value.values())
+
+    def stats(self) -> Dict[str, int]:
+        lookups = sum(self._counters.values())
+        return {
+            **self._counters,
+            "lookups": lookups,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+        }
+
+    def _remember(self, key: str, value: Dict[str, torch.Tensor]) -> None:
+        if key in self._memory:
+            self._memory_bytes -= self._nbytes(self._memory.pop(key))
+        size = self._nbytes(value)
+        if size > self._max_memory_bytes:
+            return
+        self._memory[key] = value
+        self._memory_bytes += size
+        while self._memory_bytes > self._max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= self._nbytes(evicted)
+
+    def _evict_disk(self) -> None:
+        files = sorted(self._dir.glob("*.pt"), key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in files)
+        for path in files:
+            if total <= self._max_disk_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+            self.logger.debug("Evicted cached simulation %s", path.name)
+
+    def get(self, key: str) -> Dict[str, torch.Tensor] | None:
+        """Returns copies of the cached CPU tensors or ``None`` on a miss."""
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self._counters["memory_hits"] += 1
+        elif self._dir is not None and (self._dir / f"{key}.pt").exists():
+            path = self._dir / f"{key}.pt"
+            value = torch.load(path, map_location="cpu")
+            os.utime(path)
+            self._remember(key, value)
+            self._counters["disk_hits"] += 1
+        else:
+            self._counters["misses"] += 1
+            return None
+        return {name: tensor.clone() for name, tensor in value.items()}
+
+    def put(self, key: str, value: Dict[str, torch.Tensor]) -> None:
+        stored = {name: tensor.detach().cpu().clone() for name, tensor in value.items()}
+        self._remember(key, stored)
+        if self._dir is None:
+            return
+        path = self._dir / f"{key}.pt"
+        tmp = path.with_suffix(".pt.tmp")
+        torch.save(stored, tmp)
+        os.replace(tmp, path)
+        self._evict_disk()
+
+    def clear(self) -> None:
+        self._memory.clear()
+        self._memory_bytes = 0
+        if self._dir is not None:
+            for path in self._dir.glob("*.pt"):
+                path.unlink(missing_ok=True)
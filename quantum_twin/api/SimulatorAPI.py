@@ -2,10 +2,14 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+import numpy as np
 import torch
 
+from quantum_twin.api.SimulationCache import SimulationCache
 from quantum_twin.core.BaseComponent import BaseComponent
 from quantum_twin.physics.DataSimulator import DataSimulator
+from quantum_twin.physics.PulseSequenceSolver import Waveform
+from quantum_twin.physics.SimulationOracle import SimulationOracle
 
 
 class SimulatorAPI(BaseComponent):
@@ -15,25 +19,128 @@ class SimulatorAPI(BaseComponent):
         super().__init__()
         self._params = params
         self._simulator = DataSimulator(**params)
+        self._cache = (
+            SimulationCache(
+                directory=params.get("cache_dir"),
+                max_memory_bytes=int(params.get("cache_memory_bytes", 256 * 2**20)),
+                max_disk_bytes=int(params.get("cache_disk_bytes", 2**30)),
+            )
+            if params.get("cache", False)
+            else None
+        )
         self.logger.info("SimulatorAPI ready with params %s", params)
 
-    def simulate_schrodinger(self, trajectories: int = 1) -> Dict[str, torch.Tensor]:
-        return self._simulator.generate_dataset(trajectories=trajectories, use_lindblad=False)
+    def _simulate(
+        self, trajectories: int, use_lindblad: bool, method: str | None, controls: np.ndarray | None
+    ) -> Dict[str, torch.Tensor]:
+        # Freshly sampled controls never repeat (the seeded stream advances), so only explicit controls are cached.
+        if self._cache is None or controls is None:
+            return self._simulator.generate_dataset(trajectories, use_lindblad, method, controls)
+        controls = np.asarray(controls, dtype=np.float64).reshape(-1, self._simulator.control_dim)
+        key = SimulationCache.key({**self._simulator.physics_config(use_lindblad, method), "controls": controls})
+        cached = self._cache.get(key)
+        if cached is None:
+            result = self._simulator.generate_dataset(len(controls), use_lindblad, method, controls)
+            self._cache.put(key, result)
+            return result
+        device = torch.device(self._params.get("device", "cpu"))
+        return {name: tensor.to(device) for name, tensor in cached.items()}
 
-    def simulate_lindblad(self, trajectories: int = 1) -> Dict[str, torch.Tensor]:
-        return self._simulator.generate_dataset(trajectories=trajectories, use_lindblad=True)
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters of the result cache (empty when caching is disabled)."""
+        return self._cache.stats() if self._cache is not None else {}
+
+    def simulate_schrodinger(
+        self, trajectories: int = 1, method: str | None = None, controls: np.ndarray | None = None
+    ) -> Dict[str, torch.Tensor]:
+        """Simulates pure-state dynamics; ``method="exact"`` uses the closed-form SU(2) propagator.
+
+        ``controls`` (B, 3 * num_qubits) are simulated as given instead of sampling ``trajectories`` random pulses.
+        """
+        return self._simulate(trajectories, False, method, controls)
+
+    def simulate_lindblad(
+        self, trajectories: int = 1, method: str | None = None, controls: np.ndarray | None = None
+    ) -> Dict[str, torch.Tensor]:
+        """Simulates open-system dynamics; ``method="propagator"`` uses the exponentiated Liouvillian."""
+        return self._simulate(trajectories, True, method, controls)
+
+    def simulate_refined(
+        self,
+        controls: np.ndarray,
+        errors: np.ndarray,
+        trajectories: int,
+        use_lindblad: bool = True,
+        method: str | None = None,
+    ) -> Dict[str, torch.Tensor]:
+        """Simulates ``trajectories`` new controls sampled around the ``controls`` with high surrogate ``errors``.
+
+        ``errors`` is one value per trajectory (B,) or per sample (B, steps), e.g. the trace distance between
+        ``compare_with_simulator`` outputs; the new dataset can be appended to the training set.
+        """
+        refined = self._simulator.refine_controls(controls, errors, trajectories)
+        return self._simulate(len(refined), use_lindblad, method, refined)
+
+    def oracle(self, use_lindblad: bool | None = None) -> SimulationOracle:
+        """Returns a ``SimulationOracle`` answering rho(t, controls) at arbitrary times without a new solve."""
+        if use_lindblad is None:
+            use_lindblad = bool(self._params.get("use_lindblad", True))
+        return self._simulator.oracle(use_lindblad)
+
+    def steady_state(
+        self,
+        controls: np.ndarray,
+        drift: np.ndarray | float | None = None,
+        t1: np.ndarray | float | None = None,
+        t2: np.ndarray | float | None = None,
+        tphi: np.ndarray | float | None = None,
+    ) -> np.ndarray:
+        """Long-time Lindblad state from the Liouvillian null space, batched over broadcast parameter sets.
+
+        ``controls`` (..., 3) and any noise arrays broadcast together, e.g. ``t1[:, None]`` against
+        ``t2[None, :]`` scans a grid; unset parameters use the configured values. Returns (..., 2, 2).
+        """
+        return self._simulator.steady_state(controls, drift=drift, t1=t1, t2=t2, tphi=tphi)
+
+    def simulate_pulse(
+        self,
+        waveform: Waveform,
+        t_max: float | None = None,
+        segments: int | None = None,
+        use_lindblad: bool | None = None,
+    ) -> Dict[str, torch.Tensor]:
+        """Simulates a time-dependent waveform (e.g. from ``PulseAPI``) as piecewise-constant segments."""
+        if use_lindblad is None:
+            use_lindblad = bool(self._params.get("use_lindblad", True))
+        return self._simulator.simulate_pulse(waveform, t_max=t_max, segments=segments, use_lindblad=use_lindblad)
+
+    def simulate_periodic(
+        self,
+        waveform: Waveform,
+        period: float,
+        t_max: float | None = None,
+        steps: int | None = None,
+        segments: int | None = None,
+        use_lindblad: bool | None = None,
+    ) -> Dict[str, torch.Tensor]:
+        """Simulates a periodic drive from one period of ``waveform`` at O(log periods) cost (Floquet channel)."""
+        if use_lindblad is None:
+            use_lindblad = bool(self._params.get("use_lindblad", True))
+        return self._simulator.simulate_periodic(
+            waveform, period, t_max=t_max, steps=steps, segments=segments, use_lindblad=use_lindblad
+        )
 
     def run_pulse(self, trajectories: int = 1, pulse_params: Dict[str, Any] | None = None) -> Dict[str, torch.Tensor]:
         params = dict(self._params)
         if pulse_params:
             params.update(pulse_params)
-        sim = DataSimulator(params)
+        sim = DataSimulator(**params)
         return sim.generate_dataset(trajectories=trajectories, use_lindblad=params.get("use_lindblad", True))
 
     def batch_simulate(self, batch_configs: list[Dict[str, Any]]) -> list[Dict[str, torch.Tensor]]:
         results = []
         for cfg in batch_configs:
-            sim = DataSimulator(cfg)
+            sim = DataSimulator(**cfg)
             results.append(sim.generate_dataset(trajectories=int(cfg.get("trajectories", 1)), use_lindblad=cfg.get("use_lindblad", True)))
         self.logger.info("Batch simulated %d configs", len(batch_configs))
         return results
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+import numpy as np
 import torch
 
 from quantum_twin.core.BaseComponent import BaseComponent
 from quantum_twin.deployment.ModelWrapper import ModelWrapper
 from quantum_twin.models.ModelFactory import ModelFactory
+from quantum_twin.physics.SimulationOracle import SimulationOracle
 
 
 class SurrogateAPI(BaseComponent):
@@ -37,11 +39,30 @@ class SurrogateAPI(BaseComponent):
             return None
         return self._model_wrapper._server.predict({"t": t, "controls": controls})
 
-    def compare_with_simulator(self, simulator_data: Dict[str, Any]) -> Dict[str, torch.Tensor]:
-        if self._model_wrapper is None:
-            self.logger.error("Surrogate not available; run export.py to generate ONNX.")
-            return {"simulator": simulator_data["rho"], "surrogate": torch.zeros_like(simulator_data["rho"])}
+    def compare_with_simulator(
+        self,
+        simulator_data: Dict[str, Any],
+        oracle: SimulationOracle | None = None,
+        query_t: Any | None = None,
+    ) -> Dict[str, torch.Tensor]:
+        """Compares surrogate predictions with simulated states.
+
+        With an ``oracle`` (see ``SimulatorAPI.oracle``) the reference is evaluated exactly at ``query_t``
+        (one time per row of ``simulator_data["controls"]``; defaults to ``simulator_data["t"]``), so the
+        surrogate can be checked at its own query times without a new integration.
+        """
         t = simulator_data["t"]
         controls = simulator_data["controls"]
-        pred = self._model_wrapper._server.predict({"t": t.numpy(), "controls": controls.numpy()})
-        return {"simulator": simulator_data["rho"], "surrogate": torch.tensor(pred)}
+        reference = simulator_data["rho"]
+        if query_t is not None:
+            if oracle is None:
+                raise ValueError("query_t requires an oracle to evaluate the simulator off its grid")
+            t = torch.as_tensor(np.asarray(query_t, dtype=np.float64)).reshape(-1, 1).to(controls.dtype)
+        if oracle is not None:
+            rho = oracle(t.reshape(-1).cpu().numpy(), controls.cpu().numpy())
+            reference = torch.as_tensor(rho).to(reference.dtype)
+        if self._model_wrapper is None:
+            self.logger.error("Surrogate not available; run export.py to generate ONNX.")
+            return {"simulator": reference, "surrogate": torch.zeros_like(reference)}
+        pred = self._model_wrapper._server.predict({"t": t.cpu().numpy(), "controls": controls.cpu().numpy()})
+        return {"simulator": reference, "surrogate": torch.tensor(pred)}
@@ -7,21 +7,38 @@ import torch
 from torch.utils.data import DataLoader, Dataset
 
 from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.dataloader.FastBatchLoader import FastBatchLoader
 
 
 class BaseDataLoader(BaseComponent, ABC):
-    """Abstract base for data loader wrappers."""
+    """Abstract base for data loader wrappers.
 
-    def __init__(self, batch_size: int = 32, shuffle: bool = True, num_workers: int = 0) -> None:
+    With ``fast`` the loader is a ``FastBatchLoader`` that gathers whole batches from the dataset
+    tensors (``infinite`` cycles epochs); otherwise a stock ``DataLoader`` is used.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 32,
+        shuffle: bool = True,
+        num_workers: int = 0,
+        fast: bool = False,
+        infinite: bool = False,
+        seed: int | None = None,
+    ) -> None:
         super().__init__()
         self._batch_size = batch_size
         self._shuffle = shuffle
         self._num_workers = num_workers
+        self._fast = fast
+        self._infinite = infinite
+        self._seed = seed
         self.logger.info(
-            "BaseDataLoader init batch_size=%d shuffle=%s workers=%d",
+            "BaseDataLoader init batch_size=%d shuffle=%s workers=%d fast=%s",
             batch_size,
             shuffle,
             num_workers,
+            fast,
         )
 
     @abstractmethod
@@ -29,9 +46,21 @@ class BaseDataLoader(BaseComponent, ABC):
         """Return the underlying dataset."""
         raise NotImplementedError
 
-    def loader(self) -> Iterable[Tuple[torch.Tensor, ...]]:
-        """Return a torch DataLoader iterable."""
+    def loader(
+        self, dtype: torch.dtype | None = None, device: str | torch.device | None = None
+    ) -> Iterable[Tuple[torch.Tensor, ...]]:
+        """Return a batch iterable; ``dtype``/``device`` only apply to the fast loader."""
         ds = self.dataset()
+        if self._fast:
+            return FastBatchLoader(
+                ds,
+                batch_size=self._batch_size,
+                shuffle=self._shuffle,
+                infinite=self._infinite,
+                dtype=dtype,
+                device=device,
+                seed=self._seed,
+            )
         self.logger.info("Creating DataLoader for dataset of length %d", len(ds))
         return DataLoader(ds, batch_size=self._batch_size, shuffle=self._shuffle, num_workers=self._num_workers)
 
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Iterator, Tuple
+
+import torch
+from torch.utils.data import Dataset
+
+from quantum_twin.core.BaseComponent import BaseComponent
+
+
+class FastBatchLoader(BaseComponent):
+    """Yields whole batches by indexing the dataset's backing tensors with one index tensor.
+
+    Skips the per-sample ``__getitem__`` calls and ``default_collate`` of a ``DataLoader``. The dataset
+    must provide ``gather(indices)`` returning ``(t, controls, rho)`` for a 1-D index tensor. Batches are
+    cast to ``dtype`` (real) and its complex counterpart (``rho``) on ``device``. With ``infinite`` the
+    iterator reshuffles and starts a new epoch instead of stopping.
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset,
+        batch_size: int = 32,
+        shuffle: bool = True,
+        infinite: bool = False,
+        drop_last: bool = False,
+        dtype: torch.dtype | None = None,
+        device: str | torch.device | None = None,
+        seed: int | None = None,
+    ) -> None:
+        super().__init__()
+        if not hasattr(dataset, "gather"):
+            raise ValueError(f"{type(dataset).__name__} does not support batched gather")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._dataset = dataset
+        self._batch_size = batch_size
+        self._shuffle = shuffle
+        self._infinite = infinite
+        self._drop_last = drop_last
+        self._dtype = dtype
+        self._device = torch.device(device) if device is not None else None
+        self._generator = torch.Generator()
+        if seed is not None:
+            self._generator.manual_seed(int(seed))
+        else:
+            self._generator.seed()
+        self.logger.info(
+            "FastBatchLoader ready size=%d batch_size=%d shuffle=%s infinite=%s",
+            len(dataset),
+            batch_size,
+            shuffle,
+            infinite,
+        )
+
+    def __len__(self) -> int:
+        """Batches per epoch."""
+        size = len(self._dataset)
+        return size // self._batch_size if self._drop_last else -(-size // self._batch_size)
+
+    def _order(self) -> torch.Tensor:
+        size = len(self._dataset)
+        if self._shuffle:
+            return torch.randperm(size, generator=self._generator)
+        return torch.arange(size)
+
+    def _convert(self, batch: Tuple[torch.Tensor, ...]) -> Tuple[torch.Tensor, ...]:
+        if self._dtype is None and self._device is None:
+            return batch
+        complex_dtype = None
+        if self._dtype is not None:
+            complex_dtype = torch.cfloat if self._dtype == torch.float32 else torch.cdouble
+        return tuple(
+            tensor.to(device=self._device, dtype=complex_dtype if tensor.is_complex() else self._dtype)
+            for tensor in batch
+        )
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, ...]]:
+        while True:
+            order = self._order()
+            stop = len(self) * self._batch_size if self._drop_last else len(order)
+            for start in range(0, stop, self._batch_size):
+                yield self._convert(self._dataset.gather(order[start : start + self._batch_size]))
+            if not self._infinite or stop == 0:
+                return
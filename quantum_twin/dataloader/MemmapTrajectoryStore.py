@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import torch
+
+from quantum_twin.core.BaseComponent import BaseComponent
+
+
+class MemmapTrajectoryStore(BaseComponent):
+    """On-disk column store (``t.npy``, ``controls.npy``, ``rho.npy``, optional ``fidelity.npy``) opened as memory maps.
+
+    Opened tensors are views into the page cache, so processes reading the same store share one
+    physical copy and opening cost does not grow with dataset size.
+    """
+
+    META = "store.json"
+    COLUMNS = ("t", "controls", "rho")
+    OPTIONAL_COLUMNS = ("fidelity",)
+
+    def __init__(self, directory: str | Path) -> None:
+        super().__init__()
+        self._dir = Path(directory)
+        self.logger.info("MemmapTrajectoryStore at %s", self._dir)
+
+    @staticmethod
+    def is_store(path: str | Path) -> bool:
+        return (Path(path) / MemmapTrajectoryStore.META).exists()
+
+    def write(self, samples: Dict[str, torch.Tensor]) -> Path:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        meta = {"format": "npy-columns", "columns": {}}
+        for name in self.COLUMNS + tuple(name for name in self.OPTIONAL_COLUMNS if name in samples):
+            array = np.ascontiguousarray(samples[name].detach().cpu().numpy())
+            np.save(self._dir / f"{name}.npy", array)
+            meta["columns"][name] = {"shape": list(array.shape), "dtype": str(array.dtype)}
+        (self._dir / self.META).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        self.logger.info("Wrote memmap store %s with %d samples", self._dir, len(samples["t"]))
+        return self._dir
+
+    def open(self) -> Dict[str, torch.Tensor]:
+        """Returns tensors backed by copy-on-write memory maps (no data is read eagerly)."""
+        meta = json.loads((self._dir / self.META).read_text(encoding="utf-8"))
+        columns = {
+            name: torch.from_numpy(np.load(self._dir / f"{name}.npy", mmap_mode="c")) for name in meta["columns"]
+        }
+        self.logger.info("Opened memmap store %s with %d samples", self._dir, columns["t"].shape[0])
+        return columns
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Tuple
+from typing import Any, Dict, Iterable, Sequence, Tuple
 
 import torch
 from torch.utils.data import Dataset
 
 from quantum_twin.core.BaseComponent import BaseComponent
 from quantum_twin.dataloader.BaseDataLoader import BaseDataLoader
+from quantum_twin.dataloader.MemmapTrajectoryStore import MemmapTrajectoryStore
+from quantum_twin.dataloader.SymmetryAugmentedDataset import SymmetryAugmentedDataset
 from quantum_twin.physics.DataSimulator import DataSimulator
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.ShardedDatasetWriter import ShardedDatasetWriter
+from quantum_twin.utils.StateUtils import StateUtils
+
+
+def tier_weights(fidelity: torch.Tensor, weights: Sequence[float] | None, dtype: torch.dtype) -> torch.Tensor:
+    """Per-sample loss weights looked up from fidelity tags (``weights[tag]``, default 1 for every tier)."""
+    table = torch.tensor(list(weights) if weights is not None else [1.0, 1.0], dtype=dtype, device=fidelity.device)
+    return table[fidelity.long()]
 
 
 class QuantumTrajectoryDataset(Dataset, BaseComponent):
-    """Dataset wrapping simulated qubit trajectories."""
+    """Dataset wrapping simulated qubit trajectories.
+
+    Multi-fidelity samples (with a ``fidelity`` tag column) yield a fourth element, the loss weight
+    ``fidelity_weights[tag]``.
+    """
 
-    def __init__(self, samples: Dict[str, torch.Tensor]) -> None:
+    def __init__(self, samples: Dict[str, torch.Tensor], fidelity_weights: Sequence[float] | None = None) -> None:
         BaseComponent.__init__(self)
         device_str = str(samples["t"].device)
         use_mps = device_str.startswith("mps")
@@ -22,13 +38,108 @@ class QuantumTrajectoryDataset(Dataset, BaseComponent):
         self._t = samples["t"].to(dtype=float_dtype)
         self._controls = samples["controls"].to(dtype=float_dtype)
         self._rho = samples["rho"].to(dtype=complex_dtype)
+        self._weight = (
+            tier_weights(samples["fidelity"], fidelity_weights, float_dtype) if "fidelity" in samples else None
+        )
         self.logger.info("QuantumTrajectoryDataset created with %d samples", len(self._t))
 
     def __len__(self) -> int:
         return self._t.shape[0]
 
-    def __getitem__(self, idx: int) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
-        return self._t[idx], self._controls[idx], self._rho[idx]
+    def __getitem__(self, idx: int) -> Tuple[torch.Tensor, ...]:
+        if self._weight is None:
+            return self._t[idx], self._controls[idx], self._rho[idx]
+        return self._t[idx], self._controls[idx], self._rho[idx], self._weight[idx]
+
+    def gather(self, indices: torch.Tensor) -> Tuple[torch.Tensor, ...]:
+        """Batched lookup for a 1-D index tensor."""
+        if self._weight is None:
+            return self._t[indices], self._controls[indices], self._rho[indices]
+        return self._t[indices], self._controls[indices], self._rho[indices], self._weight[indices]
+
+
+class CompactTrajectoryDataset(Dataset, BaseComponent):
+    """Trajectory-indexed dataset: one time grid, per-trajectory controls, Bloch-vector states.
+
+    Sample ``idx`` maps to ``divmod(idx, steps)`` = (trajectory, step); density matrices are decoded
+    from the stored Bloch vectors on access. Optional per-trajectory ``weights`` are yielded as a fourth
+    element, as for multi-fidelity ``QuantumTrajectoryDataset`` samples.
+    """
+
+    def __init__(
+        self,
+        times: torch.Tensor,
+        controls: torch.Tensor,
+        bloch: torch.Tensor,
+        storage_dtype: torch.dtype = torch.float32,
+        weights: torch.Tensor | None = None,
+    ) -> None:
+        BaseComponent.__init__(self)
+        use_mps = str(controls.device).startswith("mps")
+        self._float_dtype = torch.float32 if use_mps else torch.float64
+        self._times = times.to(dtype=self._float_dtype)
+        self._controls = controls.to(dtype=self._float_dtype)
+        self._bloch = bloch.to(dtype=storage_dtype)
+        self._weight = weights.to(dtype=self._float_dtype) if weights is not None else None
+        self._steps = self._times.shape[0]
+        self.logger.info(
+            "CompactTrajectoryDataset created with %d trajectories x %d steps", self._controls.shape[0], self._steps
+        )
+
+    @classmethod
+    def from_trajectories(
+        cls,
+        times: torch.Tensor,
+        controls: torch.Tensor,
+        rho: torch.Tensor,
+        storage_dtype: torch.dtype = torch.float32,
+        weights: torch.Tensor | None = None,
+    ) -> CompactTrajectoryDataset:
+        """Builds from rho of shape (trajectories, steps, 2, 2)."""
+        if rho.shape[-2:] != (2, 2):
+            raise ValueError("CompactTrajectoryDataset stores single-qubit Bloch vectors; rho must be 2x2")
+        return cls(times, controls, StateUtils.density_to_bloch(rho), storage_dtype, weights)
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: Dict[str, torch.Tensor],
+        storage_dtype: torch.dtype = torch.float32,
+        fidelity_weights: Sequence[float] | None = None,
+    ) -> CompactTrajectoryDataset:
+        """Builds from the flat per-sample format produced by ``DataSimulator.generate_dataset``."""
+        t = samples["t"].reshape(-1)
+        repeats = torch.nonzero(t[1:] == t[0]).reshape(-1)
+        steps = int(repeats[0]) + 1 if len(repeats) else t.shape[0]
+        if t.shape[0] % steps or not torch.equal(t.reshape(-1, steps), t[:steps].expand(t.shape[0] // steps, steps)):
+            raise ValueError("Samples do not share a single time grid per trajectory")
+        controls = samples["controls"].reshape(-1, steps, samples["controls"].shape[-1])
+        if not torch.equal(controls, controls[:, :1].expand_as(controls)):
+            raise ValueError("Controls are not constant within each trajectory")
+        rho = samples["rho"].reshape(-1, steps, 2, 2)
+        weights = None
+        if "fidelity" in samples:
+            weights = tier_weights(samples["fidelity"].reshape(-1, steps)[:, 0], fidelity_weights, t.dtype)
+        return cls.from_trajectories(t[:steps], controls[:, 0], rho, storage_dtype, weights)
+
+    def __len__(self) -> int:
+        return self._controls.shape[0] * self._steps
+
+    def __getitem__(self, idx: int) -> Tuple[torch.Tensor, ...]:
+        traj, step = divmod(int(idx), self._steps)
+        rho = StateUtils.bloch_to_density(self._bloch[traj, step].to(self._float_dtype))
+        if self._weight is None:
+            return self._times[step : step + 1], self._controls[traj], rho
+        return self._times[step : step + 1], self._controls[traj], rho, self._weight[traj]
+
+    def gather(self, indices: torch.Tensor) -> Tuple[torch.Tensor, ...]:
+        """Batched lookup for a 1-D index tensor; decodes all states in one call."""
+        traj = torch.div(indices, self._steps, rounding_mode="floor")
+        step = indices - traj * self._steps
+        rho = StateUtils.bloch_to_density(self._bloch[traj, step].to(self._float_dtype))
+        if self._weight is None:
+            return self._times[step].unsqueeze(-1), self._controls[traj], rho
+        return self._times[step].unsqueeze(-1), self._controls[traj], rho, self._weight[traj]
 
 
 class QuantumTrajectoryLoader(BaseDataLoader):
@@ -39,35 +150,92 @@ class QuantumTrajectoryLoader(BaseDataLoader):
         shuffle = bool(params.get("shuffle", True))
         num_workers = int(params.get("num_workers", 0))
         self._device = params.get("device", "cpu")
-        super().__init__(batch_size=batch_size, shuffle=shuffle, num_workers=num_workers)
+        super().__init__(
+            batch_size=batch_size,
+            shuffle=shuffle,
+            num_workers=num_workers,
+            fast=bool(params.get("fast", False)),
+            infinite=bool(params.get("infinite", False)),
+            seed=params.get("seed"),  # type: ignore[arg-type]
+        )
 
+        compact = bool(params.get("compact", False))
+        # Loss weight per fidelity tag [low, high] for multi-fidelity datasets.
+        weights_param = params.get("fidelity_weights")
+        fidelity_weights = [float(w) for w in weights_param] if weights_param else None  # type: ignore[union-attr]
+        storage_dtype = getattr(torch, str(params.get("compact_dtype", "float32")))
         input_path = params.get("input_path")
         if input_path:
             map_location = "cpu" if str(self._device).startswith("mps") else self._device
-            loaded = torch.load(input_path, map_location=map_location)
-            if str(self._device).startswith("mps"):
-                t = loaded["t"].float().to(self._device)
-                controls = loaded["controls"].float().to(self._device)
-                rho = loaded["rho"].to(torch.cfloat).to(self._device)
+            if MemmapTrajectoryStore.is_store(input_path):
+                loaded = MemmapTrajectoryStore(input_path).open()
+            elif ShardedDatasetWriter.is_sharded(input_path):
+                loaded = ShardedDatasetWriter.load(
+                    input_path, map_location=map_location, allow_partial=bool(params.get("allow_partial", False))
+                )
             else:
-                t = loaded["t"].to(self._device)
-                controls = loaded["controls"].to(self._device)
-                rho = loaded["rho"].to(self._device)
-            self._samples = {"t": t, "controls": controls, "rho": rho}
+                loaded = torch.load(input_path, map_location=map_location)
+            self._samples = {name: self._place(loaded[name]) for name in ("t", "controls", "rho")}
+            if "fidelity" in loaded:
+                self._samples["fidelity"] = loaded["fidelity"].to(self._device)
             self.logger.info("Loaded dataset from %s (map_location=%s)", input_path, map_location)
         else:
-            simulator_params = params.get("simulator", params)
+            simulator_params = dict(params.get("simulator", params))
+            # ``workers`` is the simulation process pool; ``num_workers`` stays the DataLoader setting.
+            for key in ("workers", "seed"):
+                if key in params:
+                    simulator_params.setdefault(key, params[key])
             self._simulator = DataSimulator(**simulator_params)  # type: ignore[arg-type]
-            self._samples = self._simulator.generate_dataset(
-                trajectories=int(params.get("trajectories", 4)),
-                use_lindblad=bool(params.get("use_lindblad", True)),
-            )
+            trajectories = int(params.get("trajectories", 4))
+            use_lindblad = bool(params.get("use_lindblad", True))
+            if compact:
+                generated = self._simulator.generate_trajectories(trajectories, use_lindblad=use_lindblad)
+                self._samples = {name: torch.from_numpy(value) for name, value in generated.items()}
+                for name in ("times", "controls", "rho"):
+                    self._samples[name] = self._place(self._samples[name])
+                if "fidelity" in self._samples:
+                    self._samples["fidelity"] = self._samples["fidelity"].to(self._device)
+            else:
+                self._samples = self._simulator.generate_dataset(trajectories=trajectories, use_lindblad=use_lindblad)
 
-        self._dataset = QuantumTrajectoryDataset(self._samples)
+        if compact and "times" in self._samples:
+            weights = None
+            if "fidelity" in self._samples:
+                weights = tier_weights(self._samples["fidelity"], fidelity_weights, self._samples["times"].dtype)
+            self._dataset = CompactTrajectoryDataset.from_trajectories(
+                self._samples["times"], self._samples["controls"], self._samples["rho"], storage_dtype, weights
+            )
+        elif compact:
+            self._dataset = CompactTrajectoryDataset.from_samples(self._samples, storage_dtype, fidelity_weights)
+        else:
+            self._dataset = QuantumTrajectoryDataset(self._samples, fidelity_weights)
+        copies = int(params.get("augment_copies", 1))
+        if copies > 1:
+            physics = dict(params.get("simulator", params))  # type: ignore[arg-type]
+            self._dataset = self._augment(self._dataset, copies, physics)
         self.logger.info("QuantumTrajectoryLoader ready with params: %s", params)
 
+    def _place(self, tensor: torch.Tensor) -> torch.Tensor:
+        """Moves a data tensor to the loader device; MPS has no float64, so it gets float32/complex64."""
+        if str(self._device).startswith("mps"):
+            tensor = tensor.to(torch.cfloat) if tensor.is_complex() else tensor.float()
+        return tensor.to(self._device)
+
+    @staticmethod
+    def _augment(dataset: Dataset, copies: int, physics: Dict[str, Any]) -> SymmetryAugmentedDataset:
+        """Z-rotation copies, checked against the drift and noise of the simulator params the data came from."""
+        if int(physics.get("num_qubits", 1)) != 1:
+            raise ValueError("augment_copies is only supported for single-qubit datasets")
+        hamiltonian = Hamiltonian(drift=float(physics.get("drift", 0.0)))
+        operators = LindbladOperators(
+            t1=float(physics.get("t1", 30.0)), t2=float(physics.get("t2", 20.0)), tphi=float(physics.get("tphi", 0.0))
+        )
+        return SymmetryAugmentedDataset(dataset, copies, hamiltonian, operators)
+
     def dataset(self) -> Dataset:
         return self._dataset
 
-    def loader(self) -> Iterable[Tuple[torch.Tensor, ...]]:
-        return super().loader()
+    def loader(
+        self, dtype: torch.dtype | None = None, device: str | torch.device | None = None
+    ) -> Iterable[Tuple[torch.Tensor, ...]]:
+        return super().loader(dtype=dtype, device=device)
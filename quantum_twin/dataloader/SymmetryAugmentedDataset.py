@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.Liouvillian import Liouvillian
+
+
+class SymmetryAugmentedDataset(Dataset, BaseComponent):
+    """Multiplies a single-qubit trajectory dataset by rotated copies about the Z axis.
+
+    With U = exp(-i phi Z / 2), the drift term commutes with U, U (c_x X + c_y Y) U^dagger rotates (c_x, c_y)
+    by phi, and the jump operators only pick up phases, so rho'(t) = U rho(t) U^dagger solves the master
+    equation for the rotated controls from the same diagonal initial state. Copy ``k`` of sample ``i`` is
+    sample ``i`` rotated by 2 pi k / copies (copy 0 is the original), computed on access. The construction
+    checks this covariance on the Liouvillian of the given physics and raises ``ValueError`` if it fails.
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset,
+        copies: int,
+        hamiltonian: Hamiltonian,
+        operators: LindbladOperators,
+        tolerance: float = 1e-9,
+    ) -> None:
+        BaseComponent.__init__(self)
+        if copies < 1:
+            raise ValueError("copies must be at least 1")
+        self.check_symmetry(hamiltonian, operators, tolerance)
+        self._dataset = dataset
+        self._copies = copies
+        self._base_len = len(dataset)
+        self._angles = 2.0 * np.pi * torch.arange(copies, dtype=torch.float64) / copies
+        self.logger.info("SymmetryAugmentedDataset with %d Z-rotated copies of %d samples", copies, self._base_len)
+
+    @staticmethod
+    def check_symmetry(hamiltonian: Hamiltonian, operators: LindbladOperators, tolerance: float = 1e-9) -> None:
+        """Raises ``ValueError`` unless L(R_phi c) = S_phi L(c) S_phi^dagger for test controls and angles.
+
+        S_phi = U kron conj(U) is the superoperator of rho -> U rho U^dagger on row-major vec(rho).
+        """
+        ops = [op.numpy() for op in operators.operators()]
+        ops = np.stack(ops) if ops else np.zeros((0, 2, 2), dtype=np.complex128)
+        controls = np.random.default_rng(0).uniform(-1.0, 1.0, size=(4, 3))
+        angles = np.array([0.3, 1.0, np.pi / 2, 2.5])
+        rotated = SymmetryAugmentedDataset.rotate(torch.from_numpy(controls), None, torch.from_numpy(angles))[0]
+        generators = Liouvillian.from_matrices(hamiltonian.build(controls).numpy(), ops)
+        expected = Liouvillian.from_matrices(hamiltonian.build(rotated).numpy(), ops)
+        unitary = np.exp(-0.5j * angles[:, None] * np.array([1.0, -1.0]))
+        phases = np.einsum("bi,bj->bij", unitary, unitary.conj()).reshape(-1, 4)
+        conjugated = phases[:, :, None] * generators * phases.conj()[:, None, :]
+        deviation = float(np.max(np.abs(conjugated - expected)))
+        if deviation > tolerance:
+            raise ValueError(
+                f"Hamiltonian/noise model is not symmetric under Z rotations (deviation {deviation:.3e}); "
+                "Z-rotation augmentation would produce wrong trajectories"
+            )
+
+    @staticmethod
+    def rotate(
+        controls: torch.Tensor, rho: torch.Tensor | None, angle: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor | None]:
+        """Rotates controls (..., 3) and rho (..., 2, 2) about Z by ``angle`` (...,)."""
+        angle = angle.to(device=controls.device, dtype=controls.dtype)
+        cos, sin = torch.cos(angle), torch.sin(angle)
+        c_x, c_y, c_z = controls.unbind(-1)
+        controls = torch.stack([cos * c_x - sin * c_y, sin * c_x + cos * c_y, c_z], dim=-1)
+        if rho is None:
+            return controls, None
+        # U rho U^dagger multiplies rho_01 by exp(-i phi) and rho_10 by exp(i phi).
+        phase = torch.polar(torch.ones_like(angle), -angle).to(rho.dtype)
+        ones = torch.ones_like(phase)
+        factors = torch.stack([torch.stack([ones, phase], dim=-1), torch.stack([phase.conj(), ones], dim=-1)], dim=-2)
+        return controls, rho * factors
+
+    def _augment(self, item: Tuple[torch.Tensor, ...], copy: torch.Tensor) -> Tuple[torch.Tensor, ...]:
+        controls, rho = self.rotate(item[1], item[2], self._angles[copy])
+        return (item[0], controls, rho) + tuple(item[3:])
+
+    def __len__(self) -> int:
+        return self._copies * self._base_len
+
+    def __getitem__(self, idx: int) -> Tuple[torch.Tensor, ...]:
+        copy, base = divmod(int(idx), self._base_len)
+        return self._augment(self._dataset[base], torch.tensor(copy))
+
+    def gather(self, indices: torch.Tensor) -> Tuple[torch.Tensor, ...]:
+        """Batched lookup for a 1-D index tensor; requires ``gather`` on the wrapped dataset."""
+        copy = torch.div(indices, self._base_len, rounding_mode="floor")
+        return self._augment(self._dataset.gather(indices - copy * self._base_len), copy)
@@ -14,9 +14,13 @@ class LindbladLoss(PhysicsLoss):
     """Physics loss for Lindblad master equation residuals."""
 
     def __init__(
-        self, hamiltonian: Hamiltonian, lindblad_ops: LindbladOperators, weights: Dict[str, float]
+        self,
+        hamiltonian: Hamiltonian,
+        lindblad_ops: LindbladOperators,
+        weights: Dict[str, float],
+        time_derivative: str = "reverse",
     ) -> None:
-        super().__init__(weights)
+        super().__init__(weights, time_derivative)
         self._hamiltonian = hamiltonian
         self._ops = lindblad_ops.operators()
         self._reg = RegularizationLoss(weights)
@@ -31,23 +35,13 @@ class LindbladLoss(PhysicsLoss):
             dissipator = dissipator + term1 - term2
         return dissipator
 
-    def compute(self, model: torch.nn.Module, batch: Dict[str, torch.Tensor]) -> torch.Tensor:
-        t = batch["t"].requires_grad_(True)
-        controls = batch["controls"]
-        rho_pred = model(t, controls)
-
+    def compute_from_states(
+        self, rho_pred: torch.Tensor, drho_dt: torch.Tensor, controls: torch.Tensor
+    ) -> torch.Tensor:
         h_mat = self._hamiltonian.build(controls)
         comm = h_mat @ rho_pred - rho_pred @ h_mat
         dissipator = self._dissipator(rho_pred)
 
-        drho_dt = torch.autograd.grad(
-            outputs=rho_pred,
-            inputs=t,
-            grad_outputs=torch.ones_like(rho_pred),
-            retain_graph=True,
-            create_graph=True,
-        )[0].view(-1, 1, 1)
-
         residual = drho_dt + 1j * comm - dissipator
         physics = torch.mean(torch.abs(residual) ** 2)
         reg = self._reg.compute(rho_pred)
@@ -7,6 +7,8 @@ from quantum_twin.losses.LindbladLoss import LindbladLoss
 from quantum_twin.losses.SchrodingerLoss import SchrodingerLoss
 from quantum_twin.physics.Hamiltonian import Hamiltonian
 from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.MultiQubitHamiltonian import MultiQubitHamiltonian
+from quantum_twin.physics.MultiQubitLindbladOperators import MultiQubitLindbladOperators
 
 
 class LossFactory(BaseComponent):
@@ -20,6 +22,21 @@ class LossFactory(BaseComponent):
     def build(self) -> SchrodingerLoss | LindbladLoss:
         weights: Dict[str, float] = self._params.get("weights", {})
         use_lindblad = bool(self._params.get("use_lindblad", True))
+        num_qubits = int(self._params.get("num_qubits", 1))
+        time_derivative = str(self._params.get("time_derivative", "reverse"))
+        if num_qubits > 1:
+            hamiltonian = MultiQubitHamiltonian(
+                num_qubits, drift=self._params.get("drift", 0.0), couplings=self._params.get("couplings")
+            )
+            if use_lindblad:
+                ops = MultiQubitLindbladOperators(
+                    num_qubits,
+                    t1=self._params.get("t1", 30.0),
+                    t2=self._params.get("t2", 20.0),
+                    tphi=self._params.get("tphi", 0.0),
+                )
+                return LindbladLoss(hamiltonian, ops, weights, time_derivative)
+            return SchrodingerLoss(hamiltonian, weights, time_derivative)
         hamiltonian = Hamiltonian(drift=float(self._params.get("drift", 0.0)))
         if use_lindblad:
             ops = LindbladOperators(
@@ -27,5 +44,5 @@ class LossFactory(BaseComponent):
                 t2=float(self._params.get("t2", 20.0)),
                 tphi=float(self._params.get("tphi", 0.0)),
             )
-            return LindbladLoss(hamiltonian, ops, weights)
-        return SchrodingerLoss(hamiltonian, weights)
+            return LindbladLoss(hamiltonian, ops, weights, time_derivative)
+        return SchrodingerLoss(hamiltonian, weights, time_derivative)
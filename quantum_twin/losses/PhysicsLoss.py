@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Tuple
 
 import torch
 
@@ -11,13 +11,49 @@ from quantum_twin.core.BaseComponent import BaseComponent
 class PhysicsLoss(BaseComponent, ABC):
     """Abstract base for physics-informed losses."""
 
-    def __init__(self, weights: Dict[str, float]) -> None:
+    TIME_DERIVATIVES = ("forward", "reverse")
+
+    def __init__(self, weights: Dict[str, float], time_derivative: str = "reverse") -> None:
         super().__init__()
+        if time_derivative not in self.TIME_DERIVATIVES:
+            raise ValueError(f"Unknown time_derivative {time_derivative!r}; expected one of {self.TIME_DERIVATIVES}")
         self._weights = weights
-        self.logger.info("PhysicsLoss weights=%s", weights)
+        self._time_derivative = time_derivative
+        self.logger.info("PhysicsLoss weights=%s time_derivative=%s", weights, time_derivative)
+
+    def time_derivative(
+        self, model: torch.nn.Module, t: torch.Tensor, controls: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Predicted states rho (B, d, d) and their per-entry time derivatives d rho / dt (B, d, d).
+
+        Each sample depends only on its own t, so one Jacobian-vector product with a unit tangent on ``t``
+        yields every entry's derivative for the whole batch. ``forward`` evaluates it with ``torch.func.jvp``
+        in one dual forward pass; ``reverse`` forms the same product as the derivative of a vector-Jacobian
+        product w.r.t. its cotangent (two backward passes). PyTorch cannot backpropagate through the
+        forward-mode eigenvector tangents of ``eigh``, so models reporting ``eigh_in_graph`` (the clamped head
+        on d > 2 states) always take the reverse path.
+        """
+        t = t.detach()
+        if self._time_derivative == "forward" and not getattr(model, "eigh_in_graph", False):
+            return torch.func.jvp(lambda time: model(time, controls), (t,), (torch.ones_like(t),))
+        t.requires_grad_(True)
+        rho = model(t, controls)
+        cotangent = torch.zeros_like(rho, requires_grad=True)
+        vjp = torch.autograd.grad(rho, t, grad_outputs=cotangent, create_graph=True)[0]
+        return rho, torch.autograd.grad(vjp, cotangent, grad_outputs=torch.ones_like(vjp), create_graph=True)[0]
 
-    @abstractmethod
     def compute(self, model: torch.nn.Module, batch: Dict[str, torch.Tensor]) -> torch.Tensor:
         """Compute the physics-informed loss for a batch."""
+        rho_pred, drho_dt = self.time_derivative(model, batch["t"], batch["controls"])
+        return self.compute_from_states(rho_pred, drho_dt, batch["controls"])
+
+    @abstractmethod
+    def compute_from_states(
+        self, rho_pred: torch.Tensor, drho_dt: torch.Tensor, controls: torch.Tensor
+    ) -> torch.Tensor:
+        """Physics loss from a prediction and its time derivative, e.g. both from one ``time_derivative`` call.
+
+        Lets a caller reuse the same forward pass (and autograd graph) for its data loss and metrics.
+        """
         raise NotImplementedError
 
@@ -6,6 +6,7 @@ import torch
 
 from quantum_twin.core.BaseComponent import BaseComponent
 from quantum_twin.utils.DensityMatrixUtils import DensityMatrixUtils
+from quantum_twin.utils.MathUtils import MathUtils
 
 
 class RegularizationLoss(BaseComponent):
@@ -22,7 +23,7 @@ class RegularizationLoss(BaseComponent):
         )
         hermitian_penalty = torch.mean(torch.abs(rho - rho.conj().transpose(-1, -2)))
         rho_psd = DensityMatrixUtils.clamp_physical(rho)
-        positivity_penalty = torch.mean(torch.relu(-torch.real(torch.linalg.eigvals(rho_psd))))
+        positivity_penalty = torch.mean(torch.relu(-MathUtils.eigvalsh(rho_psd)))
         reg = (
             self._weights.get("trace", 0.0) * trace_penalty
             + self._weights.get("hermitian", 0.0) * hermitian_penalty
@@ -5,6 +5,7 @@ from typing import Dict, List
 from quantum_twin.core.BaseComponent import BaseComponent
 from quantum_twin.metrics.FidelityMetric import FidelityMetric
 from quantum_twin.metrics.PositivityMetric import PositivityMetric
+from quantum_twin.metrics.QubitFidelityMetric import QubitFidelityMetric
 from quantum_twin.metrics.TraceDistanceMetric import TraceDistanceMetric
 from quantum_twin.metrics.MetricBase import MetricBase
 
@@ -26,5 +27,7 @@ class MetricsFactory(BaseComponent):
             metrics.append(TraceDistanceMetric())
         if "positivity" in enabled:
             metrics.append(PositivityMetric())
+        if "qubit_fidelity" in enabled:
+            metrics.append(QubitFidelityMetric())
         self.logger.info("MetricsFactory built %d metrics", len(metrics))
         return metrics
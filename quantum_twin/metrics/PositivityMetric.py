@@ -6,6 +6,7 @@ import torch
 
 from quantum_twin.metrics.MetricBase import MetricBase
 from quantum_twin.utils.DensityMatrixUtils import DensityMatrixUtils
+from quantum_twin.utils.MathUtils import MathUtils
 
 
 class PositivityMetric(MetricBase):
@@ -17,7 +18,7 @@ class PositivityMetric(MetricBase):
 
     def __call__(self, rho_pred: torch.Tensor, rho_true: torch.Tensor) -> Dict[str, float]:
         rho_psd = DensityMatrixUtils.clamp_physical(rho_pred)
-        eigvals = torch.real(torch.linalg.eigvals(rho_psd))
+        eigvals = MathUtils.eigvalsh(rho_psd)
         min_eval = torch.min(eigvals)
         value = float(min_eval.item())
         self.logger.debug("Positivity min eigenvalue=%.6f", value)
@@ -16,10 +16,8 @@ class TraceDistanceMetric(MetricBase):
         self.logger.info("TraceDistanceMetric ready")
 
     def __call__(self, rho_pred: torch.Tensor, rho_true: torch.Tensor) -> Dict[str, float]:
-        diff = rho_pred - rho_true
-        evals = torch.linalg.eigvals(diff)
-        distance = 0.5 * torch.sum(torch.abs(evals), dim=-1)
-        value = float(torch.mean(torch.real(distance)).item())
+        distance = DensityMatrixUtils.trace_distance(rho_pred, rho_true)
+        value = float(torch.mean(distance).item())
         self.logger.debug("TraceDistance=%.6f", value)
         return {"trace_distance": value}
 
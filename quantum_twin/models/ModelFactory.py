@@ -20,12 +20,16 @@ class ModelFactory(BaseComponent):
         dropout = float(self._params.get("dropout", 0.0))
         fourier = int(self._params.get("fourier_features", 0))
         input_dim = int(self._params.get("input_dim", 4))
+        num_qubits = int(self._params.get("num_qubits", 1))
+        head = str(self._params.get("head", "clamped"))
         model = PINNModel(
             input_dim=input_dim,
             layers=layers,
             activation=activation,
             dropout=dropout,
             fourier_features=fourier,
+            num_qubits=num_qubits,
+            head=head,
         )
         self.logger.info("Model constructed via ModelFactory")
         return model
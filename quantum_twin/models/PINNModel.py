@@ -11,7 +11,20 @@ from quantum_twin.utils.DensityMatrixUtils import DensityMatrixUtils
 
 
 class PINNModel(BaseComponent, nn.Module):
-    """Physics-informed neural network with Cholesky parameterization."""
+    """Physics-informed neural network with a physical density-matrix output head.
+
+    For ``num_qubits`` qubits (d = 2^N) the Cholesky heads read d^2 outputs: d Cholesky diagonal entries
+    followed by the real and imaginary parts of the d(d-1)/2 strictly lower entries (row-major).
+    ``head`` selects how rho is formed:
+
+    - ``clamped``: L L^dagger passed through ``DensityMatrixUtils.clamp_physical`` (eigenvalue floor).
+    - ``cholesky``: L L^dagger / tr(L L^dagger); Hermitian, PSD and unit trace without an eigendecomposition.
+    - ``bloch`` (single qubit, 3 outputs): rho = (I + r . sigma) / 2 with r = v / sqrt(1 + |v|^2), so |r| < 1.
+
+    The Cholesky factor and the Bloch state are each one contraction of the outputs with a fixed basis.
+    """
+
+    HEADS = ("clamped", "cholesky", "bloch")
 
     def __init__(
         self,
@@ -20,9 +33,23 @@ class PINNModel(BaseComponent, nn.Module):
         activation: str = "tanh",
         dropout: float = 0.0,
         fourier_features: int = 0,
+        num_qubits: int = 1,
+        head: str = "clamped",
     ) -> None:
         nn.Module.__init__(self)
         BaseComponent.__init__(self)
+        if head not in self.HEADS:
+            raise ValueError(f"Unknown head '{head}', expected one of {self.HEADS}")
+        if head == "bloch" and num_qubits != 1:
+            raise ValueError("The bloch head is only physical for a single qubit")
+        self._dim = 2**num_qubits
+        self._head = head
+        outputs = 3 if head == "bloch" else self._dim**2
+        if layers[-1] != outputs:
+            raise ValueError(
+                f"{num_qubits} qubit(s) with the {head} head need an output layer of {outputs}, got {layers[-1]}"
+            )
+        self.register_buffer("_basis", self._output_basis(self._dim, head), persistent=False)
         self._activation = self._get_activation(activation)
         self._dropout = dropout
         self._fourier = FourierFeatures(fourier_features) if fourier_features > 0 else None
@@ -41,13 +68,30 @@ class PINNModel(BaseComponent, nn.Module):
         modules.append(nn.Linear(prev, output_dim))
         self.network = nn.Sequential(*modules)
         self.logger.info(
-            "PINNModel initialized in=%d hidden=%s out=%d fourier=%d",
+            "PINNModel initialized in=%d hidden=%s out=%d fourier=%d head=%s",
             effective_input,
             hidden_sizes,
             output_dim,
             fourier_features,
+            head,
         )
 
+    @staticmethod
+    def _output_basis(dim: int, head: str) -> torch.Tensor:
+        """Fixed complex basis (K, d, d) that the head contracts its K coefficients with."""
+        if head == "bloch":
+            # Coefficients (1, r_x, r_y, r_z) against (I, X, Y, Z) / 2.
+            return 0.5 * torch.tensor(
+                [[[1, 0], [0, 1]], [[0, 1], [1, 0]], [[0, -1j], [1j, 0]], [[1, 0], [0, -1]]], dtype=torch.cdouble
+            )
+        rows, cols = torch.tril_indices(dim, dim, offset=-1)
+        lower = len(rows)
+        basis = torch.zeros((dim * dim, dim, dim), dtype=torch.cdouble)
+        basis[torch.arange(dim), torch.arange(dim), torch.arange(dim)] = 1.0
+        basis[dim + torch.arange(lower), rows, cols] = 1.0
+        basis[dim + lower + torch.arange(lower), rows, cols] = 1j
+        return basis
+
     def _get_activation(self, name: str) -> nn.Module:
         mapping: dict[str, Callable[[], nn.Module]] = {
             "tanh": nn.Tanh,
@@ -62,22 +106,31 @@ class PINNModel(BaseComponent, nn.Module):
             return self._fourier.encode(t)
         return t
 
+    @property
+    def head(self) -> str:
+        return self._head
+
+    @property
+    def eigh_in_graph(self) -> bool:
+        """Whether ``forward`` runs ``torch.linalg.eigh`` (clamped head on d > 2; d = 2 uses closed forms)."""
+        return self._head == "clamped" and self._dim > 2
+
     def forward(self, t: torch.Tensor, controls: torch.Tensor) -> torch.Tensor:
         t_feat = self._encode(t)
         x = torch.cat([t_feat, controls], dim=1)
         raw = self.network(x)
-        l11 = torch.nn.functional.softplus(raw[:, 0]) + 1e-6
-        l22 = torch.nn.functional.softplus(raw[:, 1]) + 1e-6
-        l21_re = raw[:, 2]
-        l21_im = raw[:, 3]
-
-        l21 = l21_re + 1j * l21_im
         complex_dtype = torch.cfloat if raw.dtype == torch.float32 else torch.cdouble
-        chol = torch.zeros((raw.shape[0], 2, 2), dtype=complex_dtype, device=raw.device)
-        chol[:, 0, 0] = l11
-        chol[:, 1, 0] = l21
-        chol[:, 1, 1] = l22
+        basis = self._basis.to(complex_dtype)
+        if self._head == "bloch":
+            radius = raw / torch.sqrt(1.0 + torch.sum(raw * raw, dim=-1, keepdim=True))
+            coeffs = torch.cat([torch.ones_like(raw[:, :1]), radius], dim=-1)
+            return torch.einsum("bk,kij->bij", coeffs.to(complex_dtype), basis)
 
+        dim = self._dim
+        coeffs = torch.cat([torch.nn.functional.softplus(raw[:, :dim]) + 1e-6, raw[:, dim:]], dim=-1)
+        chol = torch.einsum("bk,kij->bij", coeffs.to(complex_dtype), basis)
         rho = chol @ chol.conj().transpose(-1, -2)
-        rho = DensityMatrixUtils.clamp_physical(rho)
-        return rho
+        if self._head == "cholesky":
+            # tr(L L^dagger) is the squared Frobenius norm of L, i.e. of its coefficients.
+            return rho / torch.sum(coeffs * coeffs, dim=-1)[:, None, None].to(complex_dtype)
+        return DensityMatrixUtils.clamp_physical(rho)
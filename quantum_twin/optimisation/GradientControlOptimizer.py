@@ -5,28 +5,85 @@ from typing import Any, Dict, List
 import torch
 
 from quantum_twin.optimisation.ControlOptimizerBase import ControlOptimizerBase
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.TorchSimulator import TorchSimulator
+from quantum_twin.utils.StateUtils import StateUtils
 
 
 class GradientControlOptimizer(ControlOptimizerBase):
-    """Optimizes controls via simple gradient descent on a quadratic surrogate."""
+    """Optimizes constant controls by gradient ascent on the simulated final-state fidelity.
+
+    ``candidates`` random starts are simulated and updated together in one batched pass through the
+    differentiable ``TorchSimulator``; the best candidate is returned.
+    """
+
+    TARGETS = {
+        "zero": (0.0, 0.0, 1.0),
+        "one": (0.0, 0.0, -1.0),
+        "plus": (1.0, 0.0, 0.0),
+        "minus": (-1.0, 0.0, 0.0),
+        "plus_i": (0.0, 1.0, 0.0),
+        "minus_i": (0.0, -1.0, 0.0),
+    }
 
     def __init__(self, **params: Dict[str, Any]) -> None:
         super().__init__(**params)
         self._steps = int(self._params.get("steps", 100))
         self._lr = float(self._params.get("learning_rate", 1e-2))
         self._init_scale = float(self._params.get("scale", 0.5))
-        self.logger.info("GradientControlOptimizer steps=%d lr=%.4f scale=%.3f", self._steps, self._lr, self._init_scale)
+        self._candidates = int(self._params.get("candidates", 16))
+        self._t_max = float(self._params.get("t_max", 1.0))
+        self._energy_weight = float(self._params.get("energy_weight", 0.0))
+        self._seed = int(self._params.get("seed", 0))
+        self._target = self._params.get("target", "one")
+        self._simulator = TorchSimulator(
+            Hamiltonian(drift=float(self._params.get("drift", 0.0))),
+            LindbladOperators(
+                t1=float(self._params.get("t1", 30.0)),
+                t2=float(self._params.get("t2", 20.0)),
+                tphi=float(self._params.get("tphi", 0.0)),
+            ),
+            device=self._device,
+        )
+        self.logger.info(
+            "GradientControlOptimizer steps=%d lr=%.4f scale=%.3f candidates=%d",
+            self._steps,
+            self._lr,
+            self._init_scale,
+            self._candidates,
+        )
+
+    def _target_bloch(self, target: Any) -> torch.Tensor:
+        if isinstance(target, str):
+            if target not in self.TARGETS:
+                raise ValueError(f"Unknown target state '{target}', expected one of {sorted(self.TARGETS)}")
+            target = self.TARGETS[target]
+        bloch = torch.as_tensor(target, dtype=torch.float64, device=self._device)
+        if bloch.shape != (3,) or torch.linalg.norm(bloch) > 1.0 + 1e-9:
+            raise ValueError("Target must be a state name or a Bloch vector of length <= 1")
+        return bloch
 
-    def run(self) -> List[float]:
-        device = torch.device(self._device)
-        controls = torch.randn(3, device=device) * self._init_scale
-        controls = torch.nn.Parameter(controls)
-        optimizer = torch.optim.SGD([controls], lr=self._lr)
+    def run(self, target: Any | None = None) -> List[float]:
+        target_bloch = self._target_bloch(self._target if target is None else target)
+        generator = torch.Generator(device="cpu").manual_seed(self._seed)
+        init = (torch.rand(self._candidates, 3, generator=generator, dtype=torch.float64) * 2 - 1) * self._init_scale
+        controls = torch.nn.Parameter(init.to(self._device))
+        optimizer = torch.optim.Adam([controls], lr=self._lr)
         for _ in range(self._steps):
             optimizer.zero_grad()
-            loss = torch.sum(controls ** 2)
+            rho_final = self._simulator.evolve(controls, torch.full((self._candidates,), self._t_max))
+            # Fidelity with a pure target: F = (1 + r·r_target) / 2.
+            fidelity = 0.5 * (1.0 + StateUtils.density_to_bloch(rho_final) @ target_bloch)
+            energy = torch.sum(controls**2, dim=-1)
+            # Candidates are independent, so summing keeps each candidate's gradient its own.
+            loss = torch.sum(1.0 - fidelity + self._energy_weight * energy)
             loss.backward()
             optimizer.step()
-        optimized = controls.detach().cpu().tolist()
-        self.logger.info("Gradient control solution %s", optimized)
+        with torch.no_grad():
+            rho_final = self._simulator.evolve(controls, torch.full((self._candidates,), self._t_max))
+            fidelity = 0.5 * (1.0 + StateUtils.density_to_bloch(rho_final) @ target_bloch)
+            best = int(torch.argmax(fidelity - self._energy_weight * torch.sum(controls**2, dim=-1)))
+        optimized = controls[best].detach().cpu().tolist()
+        self.logger.info("Gradient control solution %s fidelity=%.6f", optimized, float(fidelity[best]))
         return optimized
@@ -5,17 +5,110 @@ from typing import Any, Dict
 import torch
 
 from quantum_twin.optimisation.OptimizerBase import OptimizerBase
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.TorchSimulator import TorchSimulator
 
 
 class ParameterEstimator(OptimizerBase):
-    """Estimates Hamiltonian parameters from data."""
+    """Estimates drift and noise parameters by fitting the differentiable simulator to data.
+
+    Data uses the dataset layout (``t`` (N, 1), ``controls`` (N, 3), ``rho`` (N, 2, 2)). ``candidates``
+    perturbed initial guesses are fitted simultaneously: parameters of shape (candidates, 1) broadcast
+    against the samples so every candidate is evaluated in one vectorized pass. ``t1``/``t2``/``tphi``
+    are optimized in log space to stay positive; their initial values are floored at ``LOG_FLOOR`` so a
+    configured 0 (e.g. ``tphi: 0.0``) can still be fitted.
+    """
+
+    FITTABLE = ("drift", "t1", "t2", "tphi")
+    LOG_PARAMS = ("t1", "t2", "tphi")
+    # Smallest initial value of a log-space parameter; log(0) would pin it at 0 with zero gradient.
+    LOG_FLOOR = 1e-6
 
     def __init__(self, **params: Dict[str, Any]) -> None:
         super().__init__(**params)
-        self.logger.info("ParameterEstimator ready")
+        self._initial = {
+            "drift": float(self._params.get("drift", 0.0)),
+            "t1": float(self._params.get("t1", 30.0)),
+            "t2": float(self._params.get("t2", 20.0)),
+            "tphi": float(self._params.get("tphi", 0.01)),
+        }
+        self._fit = list(self._params.get("fit", ["drift", "t1", "t2"]))
+        unknown = set(self._fit) - set(self.FITTABLE)
+        if unknown:
+            raise ValueError(f"Cannot fit {sorted(unknown)}; fittable parameters are {self.FITTABLE}")
+        self._steps = int(self._params.get("steps", 200))
+        self._lr = float(self._params.get("learning_rate", 5e-2))
+        self._candidates = int(self._params.get("candidates", 8))
+        self._spread = float(self._params.get("spread", 0.5))
+        self._max_samples = int(self._params.get("max_samples", 1024))
+        self._seed = int(self._params.get("seed", 0))
+        self._data_path = self._params.get("data_path")
+        self._simulator = TorchSimulator(
+            Hamiltonian(drift=self._initial["drift"]),
+            LindbladOperators(t1=self._initial["t1"], t2=self._initial["t2"], tphi=self._initial["tphi"]),
+            device=self._device,
+        )
+        self.logger.info("ParameterEstimator ready fit=%s candidates=%d", self._fit, self._candidates)
+
+    def _load_data(self, data: Dict[str, torch.Tensor] | None) -> Dict[str, torch.Tensor] | None:
+        if data is None and self._data_path:
+            data = torch.load(self._data_path, map_location="cpu")
+        if data is None:
+            return None
+        count = data["t"].shape[0]
+        generator = torch.Generator().manual_seed(self._seed)
+        idx = torch.randperm(count, generator=generator)[: self._max_samples]
+        return {
+            "t": torch.as_tensor(data["t"])[idx].reshape(-1).to(self._device, torch.float64),
+            "controls": torch.as_tensor(data["controls"])[idx].to(self._device, torch.float64),
+            "rho": torch.as_tensor(data["rho"])[idx].to(self._device, torch.cdouble),
+        }
+
+    def _initial_guesses(self) -> Dict[str, torch.Tensor]:
+        generator = torch.Generator().manual_seed(self._seed)
+        guesses = {}
+        for name in self._fit:
+            noise = torch.randn(self._candidates, 1, generator=generator, dtype=torch.float64) * self._spread
+            noise[0] = 0.0
+            if name in self.LOG_PARAMS:
+                initial = self._initial[name]
+                if initial < self.LOG_FLOOR:
+                    self.logger.warning(
+                        "Initial %s=%g floored to %g for the log-space fit", name, initial, self.LOG_FLOOR
+                    )
+                    initial = self.LOG_FLOOR
+                guesses[name] = torch.log(torch.tensor(initial, dtype=torch.float64)) + noise
+            else:
+                guesses[name] = self._initial[name] + noise
+        return {name: value.to(self._device) for name, value in guesses.items()}
+
+    def _physical(self, raw: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor | float]:
+        params: Dict[str, torch.Tensor | float] = dict(self._initial)
+        for name, value in raw.items():
+            params[name] = torch.exp(value) if name in self.LOG_PARAMS else value
+        return params
+
+    def run(self, data: Dict[str, torch.Tensor] | None = None) -> Dict[str, float]:
+        samples = self._load_data(data)
+        if samples is None:
+            self.logger.warning("No data supplied to ParameterEstimator; returning initial parameters")
+            return {name: self._initial[name] for name in self._fit}
+        raw = {name: torch.nn.Parameter(value) for name, value in self._initial_guesses().items()}
+        optimizer = torch.optim.Adam(list(raw.values()), lr=self._lr)
+
+        def candidate_losses() -> torch.Tensor:
+            rho = self._simulator.evolve(samples["controls"], samples["t"], **self._physical(raw))
+            return torch.mean(torch.abs(rho - samples["rho"]) ** 2, dim=(-1, -2, -3))
 
-    def run(self) -> Dict[str, float]:
-        # Placeholder heuristic
-        estimated = {"drift": float(self._params.get("drift", 0.0))}
-        self.logger.info("Estimated parameters %s", estimated)
+        for _ in range(self._steps):
+            optimizer.zero_grad()
+            candidate_losses().sum().backward()
+            optimizer.step()
+        with torch.no_grad():
+            losses = candidate_losses()
+            best = int(torch.argmin(losses))
+            physical = self._physical(raw)
+            estimated = {name: float(physical[name][best]) for name in self._fit}
+        self.logger.info("Estimated parameters %s loss=%.3e", estimated, float(losses[best]))
         return estimated
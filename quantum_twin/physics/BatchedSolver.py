@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.Liouvillian import Liouvillian
+
+
+class BatchedSolver(BaseComponent):
+    """Integrates a whole batch of trajectories at once on a shared time grid.
+
+    Uses an adaptive Dormand-Prince 5(4) scheme (the RK45 pair used by SciPy) with a
+    single step size shared across the batch, landing exactly on every grid point; ``max_substeps`` bounds
+    the attempted steps between two consecutive grid points. With ``fixed_steps`` the error control is
+    dropped: ``fixed_steps`` equal Dormand-Prince steps span ``[0, t_max]`` and the grid is linearly
+    interpolated between them, a cheap low-fidelity integrator.
+    """
+
+    # Dormand-Prince 5(4) tableau (the dynamics are autonomous, so the nodes are not needed).
+    _A = (
+        (),
+        (1 / 5,),
+        (3 / 40, 9 / 40),
+        (44 / 45, -56 / 15, 32 / 9),
+        (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+        (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    )
+    _B = np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+    _E = np.array([71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40])
+
+    def __init__(
+        self,
+        hamiltonian: Hamiltonian,
+        operators: LindbladOperators,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        max_substeps: int = 10000,
+        fixed_steps: int | None = None,
+    ) -> None:
+        super().__init__()
+        self._hamiltonian = hamiltonian
+        ops = [op.numpy() for op in operators.operators()]
+        self._ops = np.stack(ops) if ops else np.zeros((0, 2, 2), dtype=np.complex128)
+        self._rtol = rtol
+        self._atol = atol
+        self._max_substeps = max_substeps
+        if fixed_steps is not None and fixed_steps < 1:
+            raise ValueError("fixed_steps must be at least 1")
+        self._fixed_steps = fixed_steps
+        self.logger.info(
+            "BatchedSolver ready with %d operators rtol=%.1e atol=%.1e fixed_steps=%s",
+            len(self._ops),
+            rtol,
+            atol,
+            fixed_steps,
+        )
+
+    def _hamiltonians(self, controls: np.ndarray) -> np.ndarray:
+        return self._hamiltonian.build(np.asarray(controls, dtype=np.float64)).numpy()
+
+    def _integrate_fixed(
+        self, rhs: Callable[[np.ndarray], np.ndarray], y0: np.ndarray, times: np.ndarray
+    ) -> np.ndarray:
+        """Fixed-step Dormand-Prince on ``fixed_steps`` nodes, linearly interpolated onto ``times``."""
+        nodes = np.linspace(times[0], times[-1], self._fixed_steps + 1)
+        h = float(nodes[1] - nodes[0])
+        states = np.empty((y0.shape[0], len(nodes)) + y0.shape[1:], dtype=y0.dtype)
+        states[:, 0] = y = y0
+        for idx in range(1, len(nodes)):
+            k = [rhs(y)]
+            for stage in range(1, 6):
+                k.append(rhs(y + h * sum(a * k_j for a, k_j in zip(self._A[stage], k))))
+            y = y + h * sum(b * k_j for b, k_j in zip(self._B, k) if b != 0.0)
+            states[:, idx] = y
+        position = np.interp(times, nodes, np.arange(len(nodes), dtype=np.float64))
+        lower = np.minimum(np.floor(position).astype(np.int64), len(nodes) - 2)
+        weight = (position - lower).reshape((1, -1) + (1,) * (y0.ndim - 1))
+        self.logger.debug("BatchedSolver took %d fixed steps for %d grid points", self._fixed_steps, len(times))
+        return (1.0 - weight) * states[:, lower] + weight * states[:, lower + 1]
+
+    def _integrate(
+        self, rhs: Callable[[np.ndarray], np.ndarray], y0: np.ndarray, times: np.ndarray
+    ) -> np.ndarray:
+        """Integrate ``rhs`` for every batch row and return states at ``times`` (time axis 1)."""
+        if self._fixed_steps is not None and len(times) > 1:
+            return self._integrate_fixed(rhs, y0, times)
+        out = np.empty((y0.shape[0], len(times)) + y0.shape[1:], dtype=y0.dtype)
+        out[:, 0] = y0
+        y = y0.copy()
+        f = rhs(y)
+        h = float(times[1] - times[0]) if len(times) > 1 else 0.0
+        substeps = 0
+        for idx in range(1, len(times)):
+            t, t_end = float(times[idx - 1]), float(times[idx])
+            interval_substeps = 0
+            while t < t_end:
+                # ``h`` is the controller's step; only the attempted ``step`` is cut at the grid point, so dense
+                # output grids do not pin the shared step to the output spacing.
+                step = min(h, t_end - t)
+                k = [f]
+                for stage in range(1, 6):
+                    dy = sum(a * k_j for a, k_j in zip(self._A[stage], k))
+                    k.append(rhs(y + step * dy))
+                y_new = y + step * sum(b * k_j for b, k_j in zip(self._B, k) if b != 0.0)
+                f_new = rhs(y_new)
+                k.append(f_new)
+                err = step * sum(e * k_j for e, k_j in zip(self._E, k) if e != 0.0)
+                scale = self._atol + np.maximum(np.abs(y), np.abs(y_new)) * self._rtol
+                per_traj = np.sqrt(np.mean((np.abs(err) / scale).reshape(y.shape[0], -1) ** 2, axis=1))
+                err_norm = float(per_traj.max()) if per_traj.size else 0.0
+                substeps += 1
+                interval_substeps += 1
+                if interval_substeps > self._max_substeps:
+                    raise RuntimeError(
+                        f"BatchedSolver exceeded {self._max_substeps} substeps between t={times[idx - 1]:.6g} "
+                        f"and t={t_end:.6g}"
+                    )
+                if err_norm <= 1.0:
+                    t = t + step if t_end - t > step else t_end
+                    y, f = y_new, f_new
+                    factor = 10.0 if err_norm == 0.0 else min(10.0, 0.9 * err_norm ** -0.2)
+                    h = max(h, step * factor) if step < h else step * factor
+                else:
+                    h = step * max(0.2, 0.9 * err_norm ** -0.2)
+            out[:, idx] = y
+        self.logger.debug("BatchedSolver integrated %d grid points in %d substeps", len(times), substeps)
+        return out
+
+    def solve_lindblad(self, controls: np.ndarray, t_max: float, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns times (steps,) and rho (B, steps, 2, 2) for controls of shape (B, 3)."""
+        controls = np.atleast_2d(controls)
+        times = np.linspace(0, t_max, steps)
+        h_mat = self._hamiltonians(controls)
+        generator = Liouvillian.from_matrices(h_mat, self._ops)
+
+        def rhs(rho_vec: np.ndarray) -> np.ndarray:
+            return np.matmul(generator, rho_vec[..., None])[..., 0]
+
+        rho0 = np.zeros((controls.shape[0], 4), dtype=np.complex128)
+        rho0[:, 0] = 1.0
+        rho = self._integrate(rhs, rho0, times).reshape(controls.shape[0], len(times), 2, 2)
+        self.logger.info("Batched Lindblad solve for %d trajectories", controls.shape[0])
+        return times, rho
+
+    def solve_schrodinger(self, controls: np.ndarray, t_max: float, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns times (steps,) and rho (B, steps, 2, 2) for controls of shape (B, 3)."""
+        controls = np.atleast_2d(controls)
+        times = np.linspace(0, t_max, steps)
+        h_mat = self._hamiltonians(controls)
+
+        def rhs(psi: np.ndarray) -> np.ndarray:
+            return -1j * np.matmul(h_mat, psi[..., None])[..., 0]
+
+        psi0 = np.zeros((controls.shape[0], 2), dtype=np.complex128)
+        psi0[:, 0] = 1.0
+        psi = self._integrate(rhs, psi0, times)
+        density = np.einsum("bti,btj->btij", psi, np.conjugate(psi))
+        self.logger.info("Batched Schrödinger solve for %d trajectories", controls.shape[0])
+        return times, density
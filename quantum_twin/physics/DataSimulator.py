@@ -1,63 +1,623 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import torch
 
 from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.dataloader.MemmapTrajectoryStore import MemmapTrajectoryStore
+from quantum_twin.physics.BatchedSolver import BatchedSolver
+from quantum_twin.physics.FloquetSolver import FloquetSolver
 from quantum_twin.physics.Hamiltonian import Hamiltonian
 from quantum_twin.physics.LindbladOperators import LindbladOperators
 from quantum_twin.physics.LindbladSolver import LindbladSolver
+from quantum_twin.physics.MultiQubitHamiltonian import MultiQubitHamiltonian
+from quantum_twin.physics.MultiQubitLindbladOperators import MultiQubitLindbladOperators
+from quantum_twin.physics.MultiQubitSolver import MultiQubitSolver
+from quantum_twin.physics.PararealSolver import PararealSolver
 from quantum_twin.physics.PulseGenerator import PulseGenerator
+from quantum_twin.physics.PulseSequenceSolver import PulseSequenceSolver, Waveform
 from quantum_twin.physics.SchrodingerSolver import SchrodingerSolver
+from quantum_twin.physics.ShardedDatasetWriter import ShardedDatasetWriter
+from quantum_twin.physics.SimulationOracle import SimulationOracle
+from quantum_twin.physics.SteadyStateSolver import SteadyStateSolver
+
+
+_WORKER_SIMULATOR: "DataSimulator | None" = None
+
+
+def _init_worker(params: Dict[str, Any]) -> None:
+    global _WORKER_SIMULATOR
+    _WORKER_SIMULATOR = DataSimulator(**params)
+
+
+def _simulate_chunk(
+    source: PulseGenerator | np.ndarray,
+    start: int,
+    count: int,
+    t_max: float,
+    steps: int,
+    use_lindblad: bool,
+    method: str | None,
+    controls_name: str,
+    rho_name: str,
+    trajectories: int,
+) -> int:
+    """Worker task: samples and simulates one chunk, writing results into shared memory."""
+    controls = _WORKER_SIMULATOR._chunk_controls(source, count)
+    _, rho = _WORKER_SIMULATOR.simulate(controls, t_max, steps, use_lindblad, method)
+    dim = rho.shape[-1]
+    controls_shm = shared_memory.SharedMemory(name=controls_name)
+    rho_shm = shared_memory.SharedMemory(name=rho_name)
+    try:
+        controls_view = np.ndarray((trajectories, controls.shape[-1]), dtype=np.float64, buffer=controls_shm.buf)
+        controls_view[start : start + count] = controls
+        rho_view = np.ndarray((trajectories, steps, dim, dim), dtype=np.complex128, buffer=rho_shm.buf)
+        rho_view[start : start + count] = rho
+    finally:
+        controls_shm.close()
+        rho_shm.close()
+    return count
 
 
 class DataSimulator(BaseComponent):
     """Generates synthetic qubit trajectories via Schrödinger or Lindblad dynamics."""
 
+    LOW_FIDELITY = 0
+    HIGH_FIDELITY = 1
+
     def __init__(self, **params) -> None:
         super().__init__()
         self._params = params
         self._device = params.get("device", "cpu")
         self._output_path = Path(params.get("output_path")) if params.get("output_path") else None
-        self._pulse_gen = PulseGenerator(scale=float(params.get("pulse_scale", 0.5)))
-        self._hamiltonian = Hamiltonian(drift=float(params.get("drift", 0.0)))
+        seed = params.get("seed")
+        self._pulse_gen = PulseGenerator(
+            scale=float(params.get("pulse_scale", 0.5)),
+            seed=int(seed) if seed is not None else None,
+            sampler=str(params.get("pulse_sampler", "uniform")),
+        )
+        self._workers = int(params.get("workers", 1))
+        self._chunk_size = int(params.get("chunk_size", 256))
+        self._shard_dir = Path(params.get("shard_dir")) if params.get("shard_dir") else None
+        self._shard_size = int(params.get("shard_size", 16 * self._chunk_size))
+        self._num_qubits = int(params.get("num_qubits", 1))
+        self._dim = 2**self._num_qubits
+        self._control_dim = 3 * self._num_qubits
+        self._multi_solver = (
+            MultiQubitSolver(
+                MultiQubitHamiltonian(
+                    self._num_qubits, drift=params.get("drift", 0.0), couplings=params.get("couplings")
+                ),
+                MultiQubitLindbladOperators(
+                    self._num_qubits,
+                    t1=params.get("t1", 30.0),
+                    t2=params.get("t2", 20.0),
+                    tphi=params.get("tphi", 0.0),
+                ),
+                rtol=float(params.get("rtol", 1e-3)),
+                atol=float(params.get("atol", 1e-6)),
+                method=str(params.get("multi_qubit_method", "RK45")),
+            )
+            if self._num_qubits > 1
+            else None
+        )
+        # The single-qubit solvers (closed forms, batching, pulses, oracle) only see scalar physics params.
+        single = params if self._num_qubits == 1 else {}
+        self._hamiltonian = Hamiltonian(drift=float(single.get("drift", 0.0)))
         self._lindblad_ops = LindbladOperators(
-            t1=float(params.get("t1", 30.0)), t2=float(params.get("t2", 20.0)), tphi=float(params.get("tphi", 0.0))
+            t1=float(single.get("t1", 30.0)), t2=float(single.get("t2", 20.0)), tphi=float(single.get("tphi", 0.0))
+        )
+        rtol = float(single.get("rtol", 1e-3))
+        atol = float(single.get("atol", 1e-6))
+        self._sch_solver = SchrodingerSolver(
+            self._hamiltonian, rtol=rtol, atol=atol, method=str(single.get("schrodinger_method", "RK45"))
+        )
+        self._lin_solver = LindbladSolver(
+            self._hamiltonian,
+            self._lindblad_ops,
+            rtol=rtol,
+            atol=atol,
+            method=str(single.get("lindblad_method", "RK45")),
+            frame=str(single.get("lindblad_frame", "lab")),
+        )
+        self._frame_tolerance = single.get("frame_tolerance")
+        self._batched = bool(single.get("batched", False))
+        self._batched_solver = (
+            BatchedSolver(
+                self._hamiltonian,
+                self._lindblad_ops,
+                rtol=float(single.get("batched_rtol", 1e-6)),
+                atol=float(single.get("batched_atol", 1e-9)),
+            )
+            if self._batched
+            else None
+        )
+        self._batched_tolerance = single.get("batched_tolerance")
+        self._multi_fidelity = bool(params.get("multi_fidelity", False))
+        if self._multi_fidelity:
+            self._require_single_qubit("multi_fidelity")
+        self._high_fidelity_fraction = float(single.get("high_fidelity_fraction", 0.1))
+        if not 0.0 <= self._high_fidelity_fraction <= 1.0:
+            raise ValueError("high_fidelity_fraction must be in [0, 1]")
+        self._low_fidelity_solver = (
+            BatchedSolver(
+                self._hamiltonian,
+                self._lindblad_ops,
+                fixed_steps=int(single.get("low_fidelity_steps", 20)),
+            )
+            if self._multi_fidelity
+            else None
+        )
+        self._pulse_solver = PulseSequenceSolver(
+            self._hamiltonian,
+            self._lindblad_ops,
+            amplitude_resolution=float(single.get("pulse_amplitude_resolution", 1e-6)),
+            duration_resolution=float(single.get("pulse_duration_resolution", 1e-9)),
+            cache_size=int(single.get("pulse_cache_size", 4096)),
         )
-        self._sch_solver = SchrodingerSolver(self._hamiltonian)
-        self._lin_solver = LindbladSolver(self._hamiltonian, self._lindblad_ops)
+        self._floquet_solver = FloquetSolver(self._hamiltonian, self._lindblad_ops, self._pulse_solver)
         self.logger.info("DataSimulator configured with %s", params)
 
-    def _sample_controls(self) -> np.ndarray:
-        return self._pulse_gen.sample_pulse()
+    def _require_single_qubit(self, feature: str) -> None:
+        if self._multi_solver is not None:
+            raise ValueError(f"{feature} supports a single qubit only (num_qubits={self._num_qubits})")
+
+    def _chunks(self, trajectories: int) -> List[Tuple[PulseGenerator | np.ndarray, int, int]]:
+        """Splits trajectories into fixed-size chunks, each with its own spawned RNG stream.
+
+        With a space-filling ``pulse_sampler`` the whole design of ``trajectories`` controls is drawn in one
+        call from a single spawned stream, and each chunk carries its rows of the design instead. Chunking
+        depends only on ``chunk_size``, so a seed yields the same dataset for any worker count.
+        """
+        starts = list(range(0, trajectories, self._chunk_size))
+        counts = [min(self._chunk_size, trajectories - start) for start in starts]
+        if self._pulse_gen.sampler == "uniform":
+            sources = self._pulse_gen.spawn(len(starts))
+        else:
+            design = self._pulse_gen.spawn(1)[0].sample_pulses(trajectories, self._control_dim)
+            sources = [design[start : start + count] for start, count in zip(starts, counts)]
+        return list(zip(sources, starts, counts))
+
+    def _chunk_controls(self, source: PulseGenerator | np.ndarray, count: int) -> np.ndarray:
+        return source if isinstance(source, np.ndarray) else self.sample_chunk(source, count)
+
+    def _generate_parallel(
+        self,
+        chunks: List[Tuple[PulseGenerator | np.ndarray, int, int]],
+        t_max: float,
+        steps: int,
+        use_lindblad: bool,
+        method: str | None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        offset = chunks[0][1]
+        total = sum(count for _, _, count in chunks)
+        controls_shm = shared_memory.SharedMemory(create=True, size=max(1, total * self._control_dim * 8))
+        rho_shm = shared_memory.SharedMemory(create=True, size=max(1, total * steps * self._dim**2 * 16))
+        worker_params = {**self._params, "workers": 1, "output_path": None}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self._workers, initializer=_init_worker, initargs=(worker_params,)
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _simulate_chunk,
+                        gen,
+                        start - offset,
+                        count,
+                        t_max,
+                        steps,
+                        use_lindblad,
+                        method,
+                        controls_shm.name,
+                        rho_shm.name,
+                        total,
+                    )
+                    for gen, start, count in chunks
+                ]
+                for future in futures:
+                    future.result()
+            controls_view = np.ndarray((total, self._control_dim), dtype=np.float64, buffer=controls_shm.buf)
+            rho_view = np.ndarray((total, steps, self._dim, self._dim), dtype=np.complex128, buffer=rho_shm.buf)
+            controls, rho = controls_view.copy(), rho_view.copy()
+        finally:
+            controls_shm.close()
+            controls_shm.unlink()
+            rho_shm.close()
+            rho_shm.unlink()
+        self.logger.info("Generated %d trajectories in %d chunks on %d workers", total, len(chunks), self._workers)
+        return controls, rho
+
+    def _run_chunks(
+        self,
+        chunks: List[Tuple[PulseGenerator | np.ndarray, int, int]],
+        t_max: float,
+        steps: int,
+        use_lindblad: bool,
+        method: str | None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns controls (B, 3 * num_qubits) and rho (B, steps, d, d) for consecutive chunks."""
+        if self._workers > 1 and len(chunks) > 1:
+            return self._generate_parallel(chunks, t_max, steps, use_lindblad, method)
+        offset = chunks[0][1] if chunks else 0
+        total = sum(count for _, _, count in chunks)
+        controls = np.empty((total, self._control_dim), dtype=np.float64)
+        rho = np.empty((total, steps, self._dim, self._dim), dtype=np.complex128)
+        for gen, start, count in chunks:
+            chunk = slice(start - offset, start - offset + count)
+            controls[chunk] = self._chunk_controls(gen, count)
+            _, rho[chunk] = self.simulate(controls[chunk], t_max, steps, use_lindblad, method)
+        return controls, rho
+
+    def _tensor_dtypes(self) -> Tuple[torch.device, torch.dtype, torch.dtype]:
+        """Target device with its float and complex dtypes (single precision on MPS, which lacks float64)."""
+        device = torch.device(self._device)
+        if str(device).startswith("mps"):
+            return device, torch.float32, torch.cfloat
+        return device, torch.double, torch.cdouble
+
+    def _to_tensors(
+        self, times: np.ndarray, controls: np.ndarray, rho: np.ndarray, fidelity: np.ndarray | None = None
+    ) -> Dict[str, torch.Tensor]:
+        device, float_dtype, complex_dtype = self._tensor_dtypes()
+        steps = len(times)
+        t_tensor = torch.tensor(np.tile(times, len(controls))[:, None], dtype=float_dtype, device=device)
+        control_tensor = torch.tensor(np.repeat(controls, steps, axis=0), dtype=float_dtype, device=device)
+        rho_tensor = torch.tensor(rho.reshape(-1, self._dim, self._dim), dtype=complex_dtype, device=device)
+        samples = {"t": t_tensor, "controls": control_tensor, "rho": rho_tensor}
+        if fidelity is not None:
+            samples["fidelity"] = torch.tensor(np.repeat(fidelity, steps), dtype=torch.long, device=device)
+        return samples
+
+    def _solve_each(
+        self, controls: np.ndarray, t_max: float, steps: int, use_lindblad: bool, method: str | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        times = np.linspace(0, t_max, steps)
+        rho = np.empty((controls.shape[0], steps, self._dim, self._dim), dtype=np.complex128)
+        if self._multi_solver is not None:
+            for idx, ctrl in enumerate(controls):
+                times, rho[idx] = self._multi_solver.solve(ctrl, t_max, steps, use_lindblad, method=method)
+            return times, rho
+        solver = self._lin_solver if use_lindblad else self._sch_solver
+        for idx, ctrl in enumerate(controls):
+            times, rho[idx] = solver.solve(ctrl, t_max, steps, method=method)
+        return times, rho
+
+    def _solve_batched(
+        self, controls: np.ndarray, t_max: float, steps: int, use_lindblad: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if use_lindblad:
+            times, rho = self._batched_solver.solve_lindblad(controls, t_max, steps)
+        else:
+            times, rho = self._batched_solver.solve_schrodinger(controls, t_max, steps)
+        if self._batched_tolerance is not None and len(controls):
+            _, reference = self._solve_each(controls[:1], t_max, steps, use_lindblad, method="RK45")
+            deviation = float(np.max(np.abs(rho[:1] - reference)))
+            if deviation > float(self._batched_tolerance):
+                self.logger.error(
+                    "Batched solver deviates from per-trajectory RK45 by %.3e (tolerance %s)",
+                    deviation,
+                    self._batched_tolerance,
+                )
+                raise ValueError(
+                    f"Batched solver deviation {deviation:.3e} exceeds tolerance {self._batched_tolerance}"
+                )
+            self.logger.info("Batched solver deviation vs RK45 %.3e", deviation)
+        return times, rho
+
+    def _check_frame(self, controls: np.ndarray, t_max: float, steps: int, rho: np.ndarray, method: str | None) -> None:
+        """Compares the first rotating-frame trajectory with a lab-frame solve of the same controls."""
+        _, reference = self._lin_solver.solve(controls[0], t_max, steps, method=method, frame="lab")
+        deviation = float(np.max(np.abs(rho[0] - reference)))
+        if deviation > float(self._frame_tolerance):
+            self.logger.error(
+                "Rotating-frame solver deviates from the lab frame by %.3e (tolerance %s)",
+                deviation,
+                self._frame_tolerance,
+            )
+            raise ValueError(f"Rotating-frame deviation {deviation:.3e} exceeds tolerance {self._frame_tolerance}")
+        self.logger.info("Rotating-frame solver deviation vs lab frame %.3e", deviation)
+
+    def simulate(
+        self, controls: np.ndarray, t_max: float, steps: int, use_lindblad: bool = True, method: str | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Simulates controls (B, 3 * num_qubits) and returns times (steps,) and rho (B, steps, d, d).
+
+        ``method`` overrides the configured solver method for this call only.
+        """
+        controls = np.asarray(controls, dtype=np.float64).reshape(-1, self._control_dim)
+        if self._multi_solver is not None:
+            return self._solve_each(controls, t_max, steps, use_lindblad, method)
+        if not use_lindblad and (method or self._sch_solver.method) == "exact":
+            return self._sch_solver.solve_exact(controls, t_max, steps)
+        if use_lindblad and (method or self._lin_solver.method) == "propagator":
+            return self._lin_solver.solve_propagator(controls, t_max, steps)
+        if self._batched and method is None:
+            return self._solve_batched(controls, t_max, steps, use_lindblad)
+        times, rho = self._solve_each(controls, t_max, steps, use_lindblad, method)
+        if use_lindblad and self._lin_solver.frame != "lab" and self._frame_tolerance is not None and len(controls):
+            self._check_frame(controls, t_max, steps, rho, method)
+        return times, rho
+
+    def simulate_tiers(
+        self, controls: np.ndarray, t_max: float, steps: int, use_lindblad: bool = True, method: str | None = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Multi-fidelity simulation; returns times, rho (B, steps, 2, 2) and fidelity tags (B,).
 
-    def generate_dataset(self, trajectories: int, use_lindblad: bool = True) -> Dict[str, torch.Tensor]:
+        An evenly spaced ``high_fidelity_fraction`` of the trajectories (tag ``HIGH_FIDELITY``) takes the
+        configured solver path; the rest (tag ``LOW_FIDELITY``) is integrated together by a ``BatchedSolver``
+        taking ``low_fidelity_steps`` fixed steps over ``[0, t_max]``.
+        """
+        controls = np.asarray(controls, dtype=np.float64).reshape(-1, self._control_dim)
+        fidelity = np.full(len(controls), self.LOW_FIDELITY, dtype=np.int64)
+        high = int(round(self._high_fidelity_fraction * len(controls)))
+        if high:
+            fidelity[np.linspace(0, len(controls), high, endpoint=False).astype(np.int64)] = self.HIGH_FIDELITY
+        rho = np.empty((len(controls), steps, self._dim, self._dim), dtype=np.complex128)
+        times = np.linspace(0, t_max, steps)
+        is_high = fidelity == self.HIGH_FIDELITY
+        if is_high.any():
+            _, rho[is_high] = self.simulate(controls[is_high], t_max, steps, use_lindblad, method)
+        if not is_high.all():
+            low = self._low_fidelity_solver
+            solve = low.solve_lindblad if use_lindblad else low.solve_schrodinger
+            _, rho[~is_high] = solve(controls[~is_high], t_max, steps)
+        self.logger.info("Simulated %d high- and %d low-fidelity trajectories", is_high.sum(), (~is_high).sum())
+        return times, rho, fidelity
+
+    def simulate_pulse(
+        self,
+        waveform: Waveform,
+        t_max: float | None = None,
+        segments: int | None = None,
+        use_lindblad: bool = True,
+    ) -> Dict[str, torch.Tensor]:
+        """Simulates a shaped pulse as piecewise-constant segments with cached segment propagators.
+
+        ``waveform`` is a callable of time returning (S,) or (S, 3) controls, or one value per segment.
+        Returns ``t`` (S + 1, 1), ``controls`` (S + 1, 3) (the last segment is held at ``t_max``) and
+        ``rho`` (S + 1, 2, 2) at the segment boundaries.
+        """
+        self._require_single_qubit("simulate_pulse")
+        t_max = float(self._params.get("t_max", 1.0) if t_max is None else t_max)
+        if segments is None:
+            segments = int(self._params.get("pulse_segments", self._params.get("steps", 100)))
+        times, controls, rho = self._pulse_solver.solve(waveform, t_max, segments, use_lindblad)
+        controls = np.concatenate([controls, controls[-1:]])
+        device, float_dtype, complex_dtype = self._tensor_dtypes()
+        self.logger.info("Simulated pulse of %d segments (cache %s)", segments, self._pulse_solver.cache_info())
+        return {
+            "t": torch.tensor(times[:, None], dtype=float_dtype, device=device),
+            "controls": torch.tensor(controls, dtype=float_dtype, device=device),
+            "rho": torch.tensor(rho, dtype=complex_dtype, device=device),
+        }
+
+    def simulate_periodic(
+        self,
+        waveform: Waveform,
+        period: float,
+        t_max: float | None = None,
+        steps: int | None = None,
+        segments: int | None = None,
+        use_lindblad: bool = True,
+    ) -> Dict[str, torch.Tensor]:
+        """Simulates a periodic drive over many periods from its one-period Floquet channel.
+
+        ``waveform`` describes one period (e.g. ``PulseGenerator.sinusoidal(omega)`` with period 2 pi / omega)
+        and is split into ``segments`` pieces. Returns ``t`` (steps, 1), the active ``controls`` (steps, 3)
+        and ``rho`` (steps, 2, 2) on a uniform grid over ``[0, t_max]``.
+        """
+        self._require_single_qubit("simulate_periodic")
+        t_max = float(self._params.get("t_max", 1.0) if t_max is None else t_max)
+        steps = int(self._params.get("steps", 100) if steps is None else steps)
+        if segments is None:
+            segments = int(self._params.get("floquet_segments", 200))
+        times = np.linspace(0.0, t_max, steps)
+        controls, rho = self._floquet_solver.solve(waveform, period, times, segments, use_lindblad)
+        device, float_dtype, complex_dtype = self._tensor_dtypes()
+        self.logger.info("Simulated %.1f periods of a periodic drive with %d segments", t_max / period, segments)
+        return {
+            "t": torch.tensor(times[:, None], dtype=float_dtype, device=device),
+            "controls": torch.tensor(controls, dtype=float_dtype, device=device),
+            "rho": torch.tensor(rho, dtype=complex_dtype, device=device),
+        }
+
+    def oracle(self, use_lindblad: bool = True) -> SimulationOracle:
+        """Exact rho(t) oracle for arbitrary query times with this simulator's physics."""
+        self._require_single_qubit("oracle")
+        return SimulationOracle(self._hamiltonian, self._lindblad_ops, use_lindblad=use_lindblad)
+
+    def parareal(self) -> PararealSolver:
+        """Time-parallel Lindblad solver for long single trajectories with this simulator's physics.
+
+        The fine solves use their own tight ``parareal_rtol``/``parareal_atol``; ``parareal_tolerance``
+        defaults to ten times the larger of the two.
+        """
+        self._require_single_qubit("parareal")
+        tolerance = self._params.get("parareal_tolerance")
+        return PararealSolver(
+            self._hamiltonian,
+            self._lindblad_ops,
+            slices=int(self._params.get("parareal_slices", 8)),
+            workers=int(self._params.get("parareal_workers", self._workers)),
+            tolerance=None if tolerance is None else float(tolerance),
+            rtol=float(self._params.get("parareal_rtol", 1e-8)),
+            atol=float(self._params.get("parareal_atol", 1e-10)),
+            method=self._lin_solver.method if self._lin_solver.method != "propagator" else "RK45",
+            frame=self._lin_solver.frame,
+        )
+
+    def steady_state(self, controls: np.ndarray, **noise: Any) -> np.ndarray:
+        """Lindblad steady states (..., 2, 2); ``noise`` may override drift, t1, t2, tphi with broadcastable arrays."""
+        self._require_single_qubit("steady_state")
+        return SteadyStateSolver(self._hamiltonian, self._lindblad_ops).solve(controls, **noise)
+
+    @property
+    def control_dim(self) -> int:
+        """Width of one control vector, 3 * num_qubits."""
+        return self._control_dim
+
+    def sample_controls(self, trajectories: int) -> np.ndarray:
+        """Draws the next controls (B, 3 * num_qubits) from the pulse stream, as ``generate_trajectories`` does.
+
+        Like a ``generate_trajectories`` call, this advances the seeded stream, so a later
+        ``generate_trajectories`` call simulates different controls; pass these to it via ``controls=`` to
+        simulate exactly them.
+        """
+        chunks = self._chunks(trajectories)
+        if not chunks:
+            return np.empty((0, self._control_dim), dtype=np.float64)
+        return np.concatenate([self._chunk_controls(gen, count) for gen, _, count in chunks])
+
+    def sample_chunk(self, pulse_gen: PulseGenerator, count: int) -> np.ndarray:
+        """Controls (count, 3 * num_qubits): one (x, y, z) pulse per qubit."""
+        return pulse_gen.sample_pulses(count, self._control_dim)
+
+    def refine_controls(
+        self, controls: np.ndarray, errors: np.ndarray, count: int, radius: float | None = None
+    ) -> np.ndarray:
+        """Draws ``count`` new controls (count, 3 * num_qubits) near the controls with the largest errors.
+
+        ``errors`` holds one surrogate error per trajectory (B,) or per sample (B, ...), reduced by its maximum;
+        ``radius`` (default ``refine_radius``) is the half-width of the sampling box relative to ``pulse_scale``.
+        """
+        controls = np.asarray(controls, dtype=np.float64).reshape(-1, self._control_dim)
+        errors = np.asarray(errors, dtype=np.float64).reshape(len(controls), -1).max(axis=-1)
+        radius = float(self._params.get("refine_radius", 0.1) if radius is None else radius)
+        return self._pulse_gen.spawn(1)[0].refine(controls, errors, count, radius)
+
+    def physics_config(self, use_lindblad: bool = True, method: str | None = None) -> Dict[str, Any]:
+        """Parameters that determine a simulation result, with the solver method resolved."""
+        if self._multi_solver is not None:
+            resolved, batched = method or self._multi_solver.method, False
+        else:
+            resolved = method or (self._lin_solver if use_lindblad else self._sch_solver).method
+            closed_form = resolved == ("propagator" if use_lindblad else "exact")
+            batched = self._batched and method is None and not closed_form
+        # Per-qubit lists are hashed as given; scalars as floats.
+        physics = {"drift": 0.0, "t1": 30.0, "t2": 20.0, "tphi": 0.0}
+        config = {
+            **{
+                name: float(value) if np.isscalar(value) else list(value)
+                for name, value in ((name, self._params.get(name, default)) for name, default in physics.items())
+            },
+            "t_max": float(self._params.get("t_max", 1.0)),
+            "steps": int(self._params.get("steps", 100)),
+            "use_lindblad": use_lindblad,
+            "solver": "batched" if batched else resolved,
+            "rtol": float(self._params.get("rtol", 1e-3)),
+            "atol": float(self._params.get("atol", 1e-6)),
+        }
+        if self._multi_solver is not None:
+            config["num_qubits"] = self._num_qubits
+            config["couplings"] = self._params.get("couplings") or []
+        if self._lin_solver.frame != "lab" and use_lindblad and not batched and not closed_form:
+            config["frame"] = self._lin_solver.frame
+        if self._multi_fidelity:
+            config["high_fidelity_fraction"] = self._high_fidelity_fraction
+            config["low_fidelity_steps"] = int(self._params.get("low_fidelity_steps", 20))
+        if batched:
+            config["batched_rtol"] = float(self._params.get("batched_rtol", 1e-6))
+            config["batched_atol"] = float(self._params.get("batched_atol", 1e-9))
+        return config
+
+    def generate_trajectories(
+        self,
+        trajectories: int,
+        use_lindblad: bool = True,
+        method: str | None = None,
+        controls: np.ndarray | None = None,
+    ) -> Dict[str, np.ndarray]:
+        """Returns the shared grid ``times`` (steps,), ``controls`` (B, 3N) and ``rho`` (B, steps, d, d).
+
+        Explicit ``controls`` are simulated as given instead of sampling ``trajectories`` new ones. With
+        ``multi_fidelity`` the result also holds the per-trajectory ``fidelity`` tags (B,).
+        """
         t_max = float(self._params.get("t_max", 1.0))
         steps = int(self._params.get("steps", 100))
-        t_list, control_list, rho_list = [], [], []
-        for _ in range(trajectories):
-            controls = self._sample_controls()
-            if use_lindblad:
-                times, rho = self._lin_solver.solve(controls, t_max, steps)
-            else:
-                times, rho = self._sch_solver.solve(controls, t_max, steps)
-            for time_point, rho_point in zip(times, rho):
-                t_list.append([time_point])
-                control_list.append(controls)
-                rho_list.append(rho_point)
-        device = torch.device(self._device)
-        float_dtype = torch.float32 if str(device).startswith("mps") else torch.double
-        complex_dtype = torch.cfloat if float_dtype == torch.float32 else torch.cdouble
-        t_tensor = torch.tensor(np.array(t_list), dtype=float_dtype, device=device)
-        control_tensor = torch.tensor(np.array(control_list), dtype=float_dtype, device=device)
-        rho_tensor = torch.tensor(np.array(rho_list), dtype=complex_dtype, device=device)
-        dataset = {"t": t_tensor, "controls": control_tensor, "rho": rho_tensor}
-        if self._output_path:
+        if controls is not None:
+            controls = np.asarray(controls, dtype=np.float64).reshape(-1, self._control_dim)
+        if self._multi_fidelity:
+            if controls is None:
+                controls = self.sample_controls(trajectories)
+            times, rho, fidelity = self.simulate_tiers(controls, t_max, steps, use_lindblad, method)
+            return {"times": times, "controls": controls, "rho": rho, "fidelity": fidelity}
+        if controls is not None:
+            times, rho = self.simulate(controls, t_max, steps, use_lindblad, method)
+            return {"times": times, "controls": controls, "rho": rho}
+        controls, rho = self._run_chunks(self._chunks(trajectories), t_max, steps, use_lindblad, method)
+        return {"times": np.linspace(0, t_max, steps), "controls": controls, "rho": rho}
+
+    def generate_dataset(
+        self,
+        trajectories: int,
+        use_lindblad: bool = True,
+        method: str | None = None,
+        controls: np.ndarray | None = None,
+    ) -> Dict[str, torch.Tensor]:
+        trajectory_data = self.generate_trajectories(trajectories, use_lindblad, method, controls)
+        dataset = self._to_tensors(
+            trajectory_data["times"],
+            trajectory_data["controls"],
+            trajectory_data["rho"],
+            trajectory_data.get("fidelity"),
+        )
+        if self._output_path and self._params.get("output_format", "pt") == "npy":
+            MemmapTrajectoryStore(self._output_path).write(dataset)
+        elif self._output_path:
             self._output_path.parent.mkdir(parents=True, exist_ok=True)
             torch.save(dataset, self._output_path)
             self.logger.info("Saved dataset to %s", self._output_path)
-        self.logger.info("Generated dataset total samples=%d", len(t_tensor))
+        self.logger.info("Generated dataset total samples=%d", len(dataset["t"]))
         return dataset
+
+    def stream_dataset(
+        self, trajectories: int, use_lindblad: bool = True, method: str | None = None
+    ) -> Path:
+        """Generates shard by shard into ``shard_dir`` and returns the manifest path.
+
+        Memory is bounded by one shard; completed shards of a previous run with the same config are skipped.
+        """
+        if self._shard_dir is None:
+            raise ValueError("stream_dataset requires shard_dir")
+        if self._shard_size % self._chunk_size:
+            raise ValueError(f"shard_size {self._shard_size} must be a multiple of chunk_size {self._chunk_size}")
+        t_max = float(self._params.get("t_max", 1.0))
+        steps = int(self._params.get("steps", 100))
+        # Only settings that determine the generated data are hashed: the resolved physics and solver, plus
+        # what fixes the control draws. Pools, caches and checks (workers, cache_*, frame_tolerance, ...) may
+        # change between resumed runs.
+        config = {
+            **self.physics_config(use_lindblad, method),
+            "seed": self._params.get("seed"),
+            "pulse_scale": float(self._params.get("pulse_scale", 0.5)),
+            "pulse_sampler": self._pulse_gen.sampler,
+            "chunk_size": self._chunk_size,
+            "num_qubits": self._num_qubits,
+            "multi_fidelity": self._multi_fidelity,
+            "trajectories": trajectories,
+        }
+        if self._params.get("seed") is None:
+            self.logger.warning("Streaming without a seed; resumed shards will use fresh random controls")
+        writer = ShardedDatasetWriter(self._shard_dir, config, self._shard_size)
+        done = writer.completed_shards()
+        times = np.linspace(0, t_max, steps)
+        chunks = self._chunks(trajectories)
+        per_shard = self._shard_size // self._chunk_size
+        for index in range(0, len(chunks), per_shard):
+            shard_index = index // per_shard
+            if shard_index in done:
+                continue
+            shard_chunks = chunks[index : index + per_shard]
+            fidelity = None
+            if self._multi_fidelity:
+                controls = np.concatenate([self._chunk_controls(gen, count) for gen, _, count in shard_chunks])
+                _, rho, fidelity = self.simulate_tiers(controls, t_max, steps, use_lindblad, method)
+            else:
+                controls, rho = self._run_chunks(shard_chunks, t_max, steps, use_lindblad, method)
+            writer.write_shard(shard_index, self._to_tensors(times, controls, rho, fidelity), len(controls))
+        return writer.finalize()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+from scipy.linalg import expm
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.Liouvillian import Liouvillian
+from quantum_twin.physics.PulseSequenceSolver import PulseSequenceSolver, Waveform
+
+
+class FloquetSolver(BaseComponent):
+    """Long simulations of periodic drives from the one-period Floquet channel.
+
+    One period is split into piecewise-constant segments (propagators shared with ``PulseSequenceSolver``
+    and its cache) and multiplied into the cumulative propagators P(tau_k) and the Floquet channel
+    F = P(T). A time t = n T + tau is reached as rho(t) = P(tau) F^n rho0, where F^n is applied by binary
+    powers F, F^2, F^4, ... so the cost grows with log(n) rather than n. Inside a segment, P(tau) is
+    interpolated exactly as exp(L_k (tau - tau_k)) P(tau_k).
+    """
+
+    def __init__(
+        self,
+        hamiltonian: Hamiltonian,
+        operators: LindbladOperators,
+        pulse_solver: PulseSequenceSolver | None = None,
+    ) -> None:
+        super().__init__()
+        self._hamiltonian = hamiltonian
+        ops = [op.numpy() for op in operators.operators()]
+        self._ops = np.stack(ops) if ops else np.zeros((0, 2, 2), dtype=np.complex128)
+        self._no_ops = np.zeros((0, 2, 2), dtype=np.complex128)
+        self._pulse_solver = pulse_solver or PulseSequenceSolver(hamiltonian, operators)
+        self.logger.info("FloquetSolver ready with %d operators", len(self._ops))
+
+    def period_propagators(
+        self, waveform: Waveform, period: float, segments: int = 200, use_lindblad: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Segment controls (S, 3), generators (S, 4, 4) and cumulative propagators P(tau_k) (S + 1, 4, 4)."""
+        durations, controls = PulseSequenceSolver.discretize(waveform, period, segments)
+        steps = self._pulse_solver.segment_propagators(controls, durations, use_lindblad)
+        h_mat = self._hamiltonian.build(controls).numpy()
+        generators = Liouvillian.from_matrices(h_mat, self._ops if use_lindblad else self._no_ops)
+        cumulative = np.empty((len(steps) + 1, 4, 4), dtype=np.complex128)
+        cumulative[0] = np.eye(4)
+        for k, step in enumerate(steps):
+            cumulative[k + 1] = step @ cumulative[k]
+        return controls, generators, cumulative
+
+    def channel(self, waveform: Waveform, period: float, segments: int = 200, use_lindblad: bool = True) -> np.ndarray:
+        """Floquet channel F (4, 4) acting on row-major vec(rho) over one period."""
+        return self.period_propagators(waveform, period, segments, use_lindblad)[2][-1]
+
+    def solve(
+        self,
+        waveform: Waveform,
+        period: float,
+        times: np.ndarray,
+        segments: int = 200,
+        use_lindblad: bool = True,
+        rho0: np.ndarray | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the segment controls active at ``times`` (T, 3) and rho (T, 2, 2).
+
+        ``waveform`` describes one period ``[0, period]`` as accepted by ``PulseSequenceSolver.discretize``.
+        """
+        if period <= 0:
+            raise ValueError("period must be positive")
+        times = np.asarray(times, dtype=np.float64).reshape(-1)
+        controls, generators, cumulative = self.period_propagators(waveform, period, segments, use_lindblad)
+        if rho0 is None:
+            rho0 = np.array([[1.0, 0.0], [0.0, 0.0]], dtype=np.complex128)
+        # Times within rounding of a segment boundary snap onto it, so boundaries use the cached propagators.
+        dt = period / len(controls)
+        boundary = np.floor(times / dt + 1e-9).astype(np.int64)
+        cycles, segment = np.divmod(boundary, len(controls))
+        offset = np.clip(times - boundary * dt, 0.0, dt)
+
+        states = np.broadcast_to(np.asarray(rho0, dtype=np.complex128).reshape(4), (len(times), 4)).copy()
+        power = cumulative[-1]
+        remaining = cycles.copy()
+        while remaining.any():
+            odd = (remaining & 1).astype(bool)
+            states[odd] = states[odd] @ power.T
+            remaining >>= 1
+            if remaining.any():
+                power = power @ power
+        partial = expm(generators[segment] * offset[:, None, None]) @ cumulative[segment]
+        states = np.einsum("tij,tj->ti", partial, states)
+        self.logger.debug("Floquet solve of %d times over up to %d periods", len(times), cycles.max(initial=0))
+        return controls[segment], states.reshape(-1, 2, 2)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Callable, Tuple
 
+import numpy as np
 import torch
 
 from quantum_twin.core.BaseComponent import BaseComponent
@@ -18,9 +19,19 @@ class Hamiltonian(BaseComponent):
         self._pauli_z = torch.tensor([[1.0, 0.0], [0.0, -1.0]], dtype=torch.cdouble)
         self.logger.info("Hamiltonian initialized drift=%s", drift)
 
+    @property
+    def drift(self) -> float:
+        return self._drift
+
     def paulis(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         return self._pauli_x, self._pauli_y, self._pauli_z
 
+    def field(self, controls: np.ndarray) -> np.ndarray:
+        """Returns the field vector h with H = h·σ, i.e. (c_x, c_y, c_z + drift)."""
+        field = np.array(controls, dtype=np.float64)
+        field[..., 2] += self._drift
+        return field
+
     def build(self, controls: torch.Tensor | "np.ndarray") -> torch.Tensor:
         """Builds H = drift*Z + c_x X + c_y Y + c_z Z."""
         if not hasattr(controls, "unbind"):
@@ -29,9 +40,9 @@ class Hamiltonian(BaseComponent):
             controls = _torch.tensor(controls, dtype=_torch.double)
         hx, hy, hz = controls.unbind(-1)
         complex_dtype = torch.cfloat if hx.dtype == torch.float32 else torch.cdouble
-        px = self._pauli_x.to(complex_dtype)
-        py = self._pauli_y.to(complex_dtype)
-        pz = self._pauli_z.to(complex_dtype)
+        px = self._pauli_x.to(device=hx.device, dtype=complex_dtype)
+        py = self._pauli_y.to(device=hx.device, dtype=complex_dtype)
+        pz = self._pauli_z.to(device=hx.device, dtype=complex_dtype)
         h_mat = (
             hx.unsqueeze(-1).unsqueeze(-1) * px
             + hy.unsqueeze(-1).unsqueeze(-1) * py
@@ -18,6 +18,32 @@ class LindbladOperators(BaseComponent):
         self._tphi = tphi
         self.logger.info("LindbladOperators t1=%.3f t2=%.3f tphi=%.3f", t1, t2, tphi)
 
+    @staticmethod
+    def basis() -> torch.Tensor:
+        """Unscaled jump operators (sigma_minus, sigma_plus, sigma_z) stacked as (3, 2, 2)."""
+        return torch.tensor(
+            [[[0.0, 0.0], [1.0, 0.0]], [[0.0, 1.0], [0.0, 0.0]], [[1.0, 0.0], [0.0, -1.0]]], dtype=torch.cdouble
+        )
+
+    def rates(
+        self,
+        t1: torch.Tensor | float | None = None,
+        t2: torch.Tensor | float | None = None,
+        tphi: torch.Tensor | float | None = None,
+    ) -> torch.Tensor:
+        """Rates (1/t1, 1/(2 t2), tphi) matching ``basis()`` with shape (..., 3); non-positive times give 0.
+
+        Arguments default to the configured values and may be tensors, so rates stay differentiable.
+        """
+        t1 = torch.as_tensor(self._t1 if t1 is None else t1, dtype=torch.float64)
+        t2 = torch.as_tensor(self._t2 if t2 is None else t2, dtype=torch.float64)
+        tphi = torch.as_tensor(self._tphi if tphi is None else tphi, dtype=torch.float64)
+        t1, t2, tphi = torch.broadcast_tensors(t1, t2, tphi)
+        gamma1 = torch.where(t1 > 0, 1.0 / torch.where(t1 > 0, t1, torch.ones_like(t1)), torch.zeros_like(t1))
+        gamma2 = torch.where(t2 > 0, 0.5 / torch.where(t2 > 0, t2, torch.ones_like(t2)), torch.zeros_like(t2))
+        gamma_phi = torch.where(tphi > 0, tphi, torch.zeros_like(tphi))
+        return torch.stack([gamma1, gamma2, gamma_phi], dim=-1)
+
     def operators(self) -> List[torch.Tensor]:
         sigma_minus = torch.tensor([[0.0, 0.0], [1.0, 0.0]], dtype=torch.cdouble)
         sigma_plus = torch.tensor([[0.0, 1.0], [0.0, 0.0]], dtype=torch.cdouble)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.Liouvillian import Liouvillian
+from quantum_twin.physics.RHSKernel import RHSKernel
+
+
+class LindbladRHS(RHSKernel):
+    """Lindblad RHS with the Liouvillian superoperator built once per solve."""
+
+    def __init__(self, hamiltonian: Hamiltonian, operators: List[np.ndarray], controls: np.ndarray) -> None:
+        h_mat = hamiltonian.build(np.broadcast_to(controls, (1, 3))).squeeze(0).numpy()
+        ops = np.stack(operators) if len(operators) else np.zeros((0, 2, 2), dtype=np.complex128)
+        super().__init__(Liouvillian.from_matrices(h_mat, ops))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import numpy as np
+from scipy.linalg import expm
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+
+
+class Liouvillian(BaseComponent):
+    """Builds the Lindblad generator as a 4x4 superoperator acting on row-major vec(rho)."""
+
+    def __init__(self, hamiltonian: Hamiltonian, operators: LindbladOperators) -> None:
+        super().__init__()
+        self._hamiltonian = hamiltonian
+        ops = [op.numpy() for op in operators.operators()]
+        self._ops = np.stack(ops) if ops else np.zeros((0, 2, 2), dtype=np.complex128)
+        self.logger.info("Liouvillian ready with %d operators", len(self._ops))
+
+    @staticmethod
+    def from_matrices(h_mat: np.ndarray, ops: np.ndarray) -> np.ndarray:
+        """Superoperators for Hamiltonians (..., d, d) and collapse operators (K, d, d) or (..., K, d, d).
+
+        Uses vec(A rho B) = (A kron B^T) vec(rho) for row-major vectorization.
+        """
+        dim = h_mat.shape[-1]
+        eye = np.eye(dim, dtype=np.complex128)
+        anti = np.einsum("...kji,...kjl->...il", ops.conj(), ops)
+        h_eff = h_mat - 0.5j * anti
+        generator = -1j * (
+            np.einsum("...ij,kl->...ikjl", h_eff, eye) - np.einsum("ij,...kl->...ikjl", eye, h_eff.conj())
+        )
+        generator = generator + np.einsum("...nij,...nkl->...ikjl", ops, ops.conj())
+        return generator.reshape(generator.shape[:-4] + (dim * dim, dim * dim))
+
+    def superoperator(self, controls: np.ndarray) -> np.ndarray:
+        """Returns generators of shape (B, 4, 4) for controls of shape (B, 3)."""
+        h_mat = self._hamiltonian.build(np.atleast_2d(np.asarray(controls, dtype=np.float64))).numpy()
+        return self.from_matrices(h_mat, self._ops)
+
+    def propagator(self, controls: np.ndarray, dt: float) -> np.ndarray:
+        """Returns exp(L dt) of shape (B, 4, 4), one matrix exponential per trajectory."""
+        return expm(self.superoperator(controls) * dt)
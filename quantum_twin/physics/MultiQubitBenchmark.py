@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.Liouvillian import Liouvillian
+from quantum_twin.physics.MultiQubitHamiltonian import MultiQubitHamiltonian
+from quantum_twin.physics.MultiQubitLindbladOperators import MultiQubitLindbladOperators
+from quantum_twin.physics.MultiQubitSolver import MultiQubitSolver
+
+
+class MultiQubitBenchmark(BaseComponent):
+    """Measures memory and time of the sparse N-qubit Lindblad solver across qubit counts.
+
+    Each qubit count uses a nearest-neighbour chain with ZZ and XY couplings and per-qubit noise. The
+    report compares the stored sparse operator bytes with the dense d^2 x d^2 superoperator, and times
+    single RHS evaluations (sparse vs dense, the latter only up to ``max_dense_qubits``) and a full solve.
+    """
+
+    def __init__(
+        self,
+        t_max: float = 1.0,
+        steps: int = 20,
+        rhs_repeats: int = 20,
+        max_dense_qubits: int = 5,
+        seed: int = 0,
+    ) -> None:
+        super().__init__()
+        self._t_max = t_max
+        self._steps = steps
+        self._rhs_repeats = rhs_repeats
+        self._max_dense_qubits = max_dense_qubits
+        self._rng = np.random.default_rng(seed)
+        self.logger.info("MultiQubitBenchmark steps=%d max_dense_qubits=%d", steps, max_dense_qubits)
+
+    @staticmethod
+    def _chain(num_qubits: int) -> List[Dict[str, Any]]:
+        couplings = []
+        for i in range(num_qubits - 1):
+            couplings.append({"i": i, "j": i + 1, "type": "zz", "strength": 0.05})
+            couplings.append({"i": i, "j": i + 1, "type": "xy", "strength": 0.02})
+        return couplings
+
+    @staticmethod
+    def _sparse_bytes(matrix: Any) -> int:
+        return int(matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes)
+
+    def _time(self, fn: Any) -> float:
+        start = time.perf_counter()
+        for _ in range(self._rhs_repeats):
+            fn()
+        return (time.perf_counter() - start) / self._rhs_repeats
+
+    def run_one(self, num_qubits: int) -> Dict[str, float]:
+        hamiltonian = MultiQubitHamiltonian(
+            num_qubits, drift=self._rng.uniform(-0.05, 0.05, num_qubits).tolist(), couplings=self._chain(num_qubits)
+        )
+        operators = MultiQubitLindbladOperators(
+            num_qubits,
+            t1=self._rng.uniform(20, 40, num_qubits).tolist(),
+            t2=self._rng.uniform(10, 30, num_qubits).tolist(),
+        )
+        solver = MultiQubitSolver(hamiltonian, operators)
+        controls = self._rng.uniform(-0.5, 0.5, 3 * num_qubits)
+        h_mat = hamiltonian.sparse(controls)
+        ops = operators.sparse_operators()
+        dim = hamiltonian.dim
+
+        rho = np.zeros((dim, dim), dtype=np.complex128)
+        rho[0, 0] = 1.0
+        rhs = solver.rhs(controls)
+        state = rho.reshape(-1).view(np.float64)
+
+        result = {
+            "num_qubits": num_qubits,
+            "dim": dim,
+            "nnz": int(h_mat.nnz + sum(op.nnz for op in ops)),
+            "sparse_bytes": self._sparse_bytes(h_mat) + sum(self._sparse_bytes(op) for op in ops),
+            "dense_superoperator_bytes": 16 * dim**4,
+            "sparse_rhs_s": self._time(lambda: rhs(0.0, state)),
+            "dense_rhs_s": float("nan"),
+        }
+        if num_qubits <= self._max_dense_qubits:
+            generator = Liouvillian.from_matrices(h_mat.toarray(), np.stack([op.toarray() for op in ops]))
+            vec = rho.reshape(-1)
+            result["dense_rhs_s"] = self._time(lambda: generator @ vec)
+        start = time.perf_counter()
+        solver.solve(controls, self._t_max, self._steps)
+        result["solve_s"] = time.perf_counter() - start
+        self.logger.info("Benchmark %s", result)
+        return result
+
+    def run(self, qubits: Sequence[int] = (2, 3, 4, 5, 6)) -> List[Dict[str, float]]:
+        return [self.run_one(int(n)) for n in qubits]
+
+    @staticmethod
+    def format(results: List[Dict[str, float]]) -> str:
+        header = f"{'qubits':>6} {'dim':>5} {'nnz':>8} {'sparse KiB':>11} {'dense L MiB':>12} "
+        header += f"{'sparse rhs ms':>14} {'dense rhs ms':>13} {'solve s':>8}"
+        lines = [header]
+        for row in results:
+            lines.append(
+                f"{row['num_qubits']:>6} {row['dim']:>5} {row['nnz']:>8} {row['sparse_bytes'] / 2**10:>11.1f} "
+                f"{row['dense_superoperator_bytes'] / 2**20:>12.1f} {1e3 * row['sparse_rhs_s']:>14.3f} "
+                f"{1e3 * row['dense_rhs_s']:>13.3f} {row['solve_s']:>8.3f}"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="N-qubit sparse solver scaling benchmark")
+    parser.add_argument("--qubits", type=int, nargs="+", default=[2, 3, 4, 5, 6], help="Qubit counts to run")
+    parser.add_argument("--steps", type=int, default=20, help="Output grid points per solve")
+    parser.add_argument("--max-dense-qubits", type=int, default=5, help="Largest N timed with a dense superoperator")
+    args = parser.parse_args()
+    bench = MultiQubitBenchmark(steps=args.steps, max_dense_qubits=args.max_dense_qubits)
+    print(MultiQubitBenchmark.format(bench.run(args.qubits)))
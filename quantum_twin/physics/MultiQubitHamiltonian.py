@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import scipy.sparse as sp
+import torch
+
+from quantum_twin.core.BaseComponent import BaseComponent
+
+PAULI_X = np.array([[0.0, 1.0], [1.0, 0.0]], dtype=np.complex128)
+PAULI_Y = np.array([[0.0, -1.0j], [1.0j, 0.0]], dtype=np.complex128)
+PAULI_Z = np.array([[1.0, 0.0], [0.0, -1.0]], dtype=np.complex128)
+
+
+def embed(op: np.ndarray, qubit: int, num_qubits: int) -> sp.csr_matrix:
+    """Sparse ``I ⊗ ... ⊗ op ⊗ ... ⊗ I`` with qubit 0 as the leftmost (most significant) factor."""
+    return sp.kron(
+        sp.kron(sp.identity(2**qubit, dtype=np.complex128, format="csr"), sp.csr_matrix(op), format="csr"),
+        sp.identity(2 ** (num_qubits - qubit - 1), dtype=np.complex128, format="csr"),
+        format="csr",
+    )
+
+
+def per_qubit(value: float | Sequence[float], num_qubits: int, name: str) -> List[float]:
+    """Broadcasts a scalar to one value per qubit and validates list lengths."""
+    if np.isscalar(value):
+        return [float(value)] * num_qubits
+    values = [float(v) for v in value]
+    if len(values) != num_qubits:
+        raise ValueError(f"{name} needs {num_qubits} values, got {len(values)}")
+    return values
+
+
+class MultiQubitHamiltonian(BaseComponent):
+    """Coupled N-qubit Hamiltonian in sparse Kronecker form.
+
+    H = sum_q [c_qx X_q + c_qy Y_q + (c_qz + drift_q) Z_q] + sum_(i,j) J_zz Z_i Z_j + J_xy (X_i X_j + Y_i Y_j)
+
+    Controls are flattened per qubit as (c_0x, c_0y, c_0z, c_1x, ...). Every term is stored as a sparse
+    embedded operator, so building H costs O(number of nonzeros) rather than O(4^N).
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        drift: float | Sequence[float] = 0.0,
+        couplings: List[Dict[str, Any]] | None = None,
+    ) -> None:
+        super().__init__()
+        if num_qubits < 1:
+            raise ValueError("num_qubits must be at least 1")
+        self._num_qubits = num_qubits
+        self._drift = per_qubit(drift, num_qubits, "drift")
+        self._couplings = list(couplings or [])
+        self._controls = [
+            embed(pauli, qubit, num_qubits) for qubit in range(num_qubits) for pauli in (PAULI_X, PAULI_Y, PAULI_Z)
+        ]
+        static = sp.csr_matrix((self.dim, self.dim), dtype=np.complex128)
+        for qubit, drift_q in enumerate(self._drift):
+            static = static + drift_q * self._controls[3 * qubit + 2]
+        for coupling in self._couplings:
+            i, j = int(coupling["i"]), int(coupling["j"])
+            if not (0 <= i < num_qubits and 0 <= j < num_qubits) or i == j:
+                raise ValueError(f"Invalid coupling between qubits {i} and {j}")
+            kind = str(coupling.get("type", "zz")).lower()
+            strength = float(coupling.get("strength", 0.0))
+            if kind == "zz":
+                static = static + strength * (self._controls[3 * i + 2] @ self._controls[3 * j + 2])
+            elif kind == "xy":
+                xx = self._controls[3 * i] @ self._controls[3 * j]
+                yy = self._controls[3 * i + 1] @ self._controls[3 * j + 1]
+                static = static + strength * (xx + yy)
+            else:
+                raise ValueError(f"Unknown coupling type '{kind}', expected 'zz' or 'xy'")
+        self._static = static.tocsr()
+        self._dense_basis: torch.Tensor | None = None
+        self.logger.info(
+            "MultiQubitHamiltonian num_qubits=%d couplings=%d nnz(static)=%d",
+            num_qubits,
+            len(self._couplings),
+            self._static.nnz,
+        )
+
+    @property
+    def num_qubits(self) -> int:
+        return self._num_qubits
+
+    @property
+    def dim(self) -> int:
+        return 2**self._num_qubits
+
+    def sparse(self, controls: np.ndarray) -> sp.csr_matrix:
+        """Sparse H for one flattened control vector of length 3 * num_qubits."""
+        controls = np.asarray(controls, dtype=np.float64).reshape(-1)
+        if controls.shape[0] != 3 * self._num_qubits:
+            raise ValueError(f"Expected {3 * self._num_qubits} controls, got {controls.shape[0]}")
+        h_mat = self._static.copy()
+        for value, op in zip(controls, self._controls):
+            if value != 0.0:
+                h_mat = h_mat + value * op
+        return h_mat.tocsr()
+
+    def build(self, controls: torch.Tensor | np.ndarray) -> torch.Tensor:
+        """Dense torch H (..., d, d) for controls (..., 3 * num_qubits), as used by the physics losses."""
+        if not hasattr(controls, "unbind"):
+            controls = torch.tensor(controls, dtype=torch.double)
+        complex_dtype = torch.cfloat if controls.dtype == torch.float32 else torch.cdouble
+        if self._dense_basis is None:
+            ops = [self._static] + self._controls
+            self._dense_basis = torch.tensor(np.stack([op.toarray() for op in ops]), dtype=torch.cdouble)
+        basis = self._dense_basis.to(device=controls.device, dtype=complex_dtype)
+        h_mat = torch.einsum("...k,kij->...ij", controls.to(complex_dtype), basis[1:])
+        return h_mat + basis[0]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import List, Sequence
+
+import numpy as np
+import scipy.sparse as sp
+import torch
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.MultiQubitHamiltonian import PAULI_Z, embed, per_qubit
+
+SIGMA_MINUS = np.array([[0.0, 0.0], [1.0, 0.0]], dtype=np.complex128)
+SIGMA_PLUS = np.array([[0.0, 1.0], [0.0, 0.0]], dtype=np.complex128)
+
+
+class MultiQubitLindbladOperators(BaseComponent):
+    """Per-qubit collapse operators (T1, T2, Tphi) embedded as sparse N-qubit operators.
+
+    Each qubit gets the single-qubit channels of ``LindbladOperators``: sqrt(1/t1) sigma_minus,
+    sqrt(1/(2 t2)) sigma_plus and sqrt(tphi) sigma_z; scalars apply to every qubit.
+    """
+
+    def __init__(
+        self,
+        num_qubits: int,
+        t1: float | Sequence[float] = 30.0,
+        t2: float | Sequence[float] = 20.0,
+        tphi: float | Sequence[float] = 0.0,
+    ) -> None:
+        super().__init__()
+        self._num_qubits = num_qubits
+        self._t1 = per_qubit(t1, num_qubits, "t1")
+        self._t2 = per_qubit(t2, num_qubits, "t2")
+        self._tphi = per_qubit(tphi, num_qubits, "tphi")
+        self.logger.info(
+            "MultiQubitLindbladOperators num_qubits=%d t1=%s t2=%s tphi=%s", num_qubits, self._t1, self._t2, self._tphi
+        )
+
+    def sparse_operators(self) -> List[sp.csr_matrix]:
+        ops: List[sp.csr_matrix] = []
+        for qubit in range(self._num_qubits):
+            if self._t1[qubit] > 0:
+                ops.append(np.sqrt(1.0 / self._t1[qubit]) * embed(SIGMA_MINUS, qubit, self._num_qubits))
+            if self._t2[qubit] > 0:
+                ops.append(np.sqrt(1.0 / (2 * self._t2[qubit])) * embed(SIGMA_PLUS, qubit, self._num_qubits))
+            if self._tphi[qubit] > 0:
+                ops.append(np.sqrt(self._tphi[qubit]) * embed(PAULI_Z, qubit, self._num_qubits))
+        return ops
+
+    def operators(self) -> List[torch.Tensor]:
+        """Dense torch copies, interchangeable with ``LindbladOperators.operators`` in the losses."""
+        return [torch.tensor(op.toarray(), dtype=torch.cdouble) for op in self.sparse_operators()]
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.LindbladSolver import LindbladSolver
+from quantum_twin.physics.Liouvillian import Liouvillian
+
+_WORKER_SOLVER: "LindbladSolver | None" = None
+
+
+def _init_worker(solver: LindbladSolver) -> None:
+    global _WORKER_SOLVER
+    _WORKER_SOLVER = solver
+
+
+def _fine_slice(controls: np.ndarray, span: float, count: int, rho0: np.ndarray) -> np.ndarray:
+    """Worker task: fine solve of one time slice, returning rho (count, 2, 2) on the slice grid."""
+    return _WORKER_SOLVER.solve(controls, span, count, rho0=rho0)[1]
+
+
+class PararealSolver(BaseComponent):
+    """Time-parallel Lindblad integration of one long trajectory (Parareal).
+
+    The output grid is cut into ``slices`` consecutive time slices. A cheap coarse propagator (fixed RK4 steps
+    over each slice, applied as one 4x4 matrix built from the Liouvillian) sweeps serially, the
+    configured fine ``LindbladSolver`` runs all unconverged slices in parallel, and the slice start states are
+    corrected with U_(n+1) <- G(U_n^new) + F(U_n^old) - G(U_n^old) until they change by less than
+    ``tolerance`` (default ``10 * max(rtol, atol)``; corrections cannot settle below the fine solver's own
+    error, so a tighter tolerance runs every slice serially). After ``k`` iterations the first ``k`` slices
+    equal the serial fine solution (up to the fine solver's own tolerance), so at most ``slices`` iterations
+    are needed; the speedup is roughly ``min(workers, slices) / iterations`` when fine solves dominate.
+    """
+
+    def __init__(
+        self,
+        hamiltonian: Hamiltonian,
+        operators: LindbladOperators,
+        slices: int = 8,
+        workers: int = 4,
+        tolerance: float | None = None,
+        max_iterations: int | None = None,
+        rtol: float = 1e-3,
+        atol: float = 1e-6,
+        method: str = "RK45",
+        frame: str = "lab",
+        coarse_steps: int = 20,
+    ) -> None:
+        super().__init__()
+        if slices < 1:
+            raise ValueError("slices must be at least 1")
+        self._fine = LindbladSolver(hamiltonian, operators, rtol=rtol, atol=atol, method=method, frame=frame)
+        self._liouvillian = Liouvillian(hamiltonian, operators)
+        self._coarse_steps = coarse_steps
+        self._slices = slices
+        self._workers = workers
+        if tolerance is None:
+            tolerance = 10.0 * max(rtol, atol)
+        elif tolerance < max(rtol, atol):
+            self.logger.warning(
+                "Parareal tolerance %g is below the fine solver's rtol/atol (%g/%g); expect up to %d iterations",
+                tolerance,
+                rtol,
+                atol,
+                slices,
+            )
+        self._tolerance = tolerance
+        self.last_converged = False
+        self._max_iterations = slices if max_iterations is None else min(max_iterations, slices)
+        self.last_iterations = 0
+        self.logger.info(
+            "PararealSolver ready slices=%d workers=%d tolerance=%g method=%s", slices, workers, tolerance, method
+        )
+
+    def _coarse_propagator(self, controls: np.ndarray, span: float) -> np.ndarray:
+        """R(h L)^m for m fixed RK4 steps of size h = span / m; a linear map, as Parareal needs.
+
+        m is at least ``coarse_steps`` and large enough that h ||L|| <= 0.1, keeping RK4 stable and accurate
+        on long slices; the power costs O(log m) products.
+        """
+        generator = self._liouvillian.superoperator(controls)[0]
+        substeps = max(self._coarse_steps, int(np.ceil(10.0 * span * np.linalg.norm(generator, 2))))
+        scaled = generator * (span / substeps)
+        step = np.eye(4, dtype=np.complex128)
+        term = np.eye(4, dtype=np.complex128)
+        for order in range(1, 5):
+            term = term @ scaled / order
+            step = step + term
+        return np.linalg.matrix_power(step, substeps)
+
+    def _fine_slices(
+        self, pool: Executor | None, controls: np.ndarray, jobs: List[Tuple[float, int, np.ndarray]]
+    ) -> List[np.ndarray]:
+        if pool is None:
+            return [self._fine.solve(controls, span, count, rho0=rho0)[1] for span, count, rho0 in jobs]
+        futures = [pool.submit(_fine_slice, controls, span, count, rho0) for span, count, rho0 in jobs]
+        return [future.result() for future in futures]
+
+    def solve(
+        self, controls: np.ndarray, t_max: float, steps: int, rho0: np.ndarray | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns times (steps,) and rho (steps, 2, 2) for one control vector (3,)."""
+        controls = np.asarray(controls, dtype=np.float64).reshape(3)
+        times = np.linspace(0, t_max, steps)
+        if rho0 is None:
+            rho0 = np.array([[1.0, 0.0], [0.0, 0.0]], dtype=np.complex128)
+        # Slice n covers grid points bounds[n] .. bounds[n + 1]; neighbouring slices share their boundary point.
+        bounds = np.unique(np.linspace(0, steps - 1, self._slices + 1).round().astype(int))
+        spans = [float(times[end] - times[start]) for start, end in zip(bounds[:-1], bounds[1:])]
+        counts = [int(end - start + 1) for start, end in zip(bounds[:-1], bounds[1:])]
+        slices = len(spans)
+
+        propagators = {span: self._coarse_propagator(controls, span) for span in set(spans)}
+
+        def coarse_step(n: int, rho: np.ndarray) -> np.ndarray:
+            return (propagators[spans[n]] @ rho.reshape(4)).reshape(2, 2)
+
+        starts = [np.asarray(rho0, dtype=np.complex128)]
+        coarse = []
+        for n in range(slices):
+            coarse.append(coarse_step(n, starts[-1]))
+            starts.append(coarse[-1])
+        fine: List[np.ndarray] = [np.empty(0)] * slices
+        pool = (
+            ProcessPoolExecutor(
+                max_workers=min(self._workers, slices), initializer=_init_worker, initargs=(self._fine,)
+            )
+            if self._workers > 1 and slices > 1
+            else None
+        )
+        try:
+            iteration = 0
+            converged = False
+            while iteration < self._max_iterations:
+                jobs = [(spans[n], counts[n], starts[n]) for n in range(iteration, slices)]
+                for n, rho in enumerate(self._fine_slices(pool, controls, jobs), start=iteration):
+                    fine[n] = rho
+                iteration += 1
+                # Slice ``iteration - 1`` started from an exact state, so its fine end state is exact too.
+                change = 0.0
+                new_start = fine[iteration - 1][-1]
+                for n in range(iteration, slices + 1):
+                    change = max(change, float(np.max(np.abs(new_start - starts[n]))))
+                    starts[n] = new_start
+                    if n < slices:
+                        guess = coarse_step(n, new_start)
+                        new_start = guess + fine[n][-1] - coarse[n]
+                        coarse[n] = guess
+                self.logger.debug("Parareal iteration %d max correction %.3e", iteration, change)
+                if change < self._tolerance:
+                    converged = True
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self.last_iterations = iteration
+        # Running all slices makes the result exact even if the last correction exceeded the tolerance.
+        self.last_converged = converged or iteration == slices
+        rho = np.empty((steps, 2, 2), dtype=np.complex128)
+        for start, end, states in zip(bounds[:-1], bounds[1:], fine):
+            rho[start : end + 1] = states
+        if converged:
+            self.logger.info("Parareal converged in %d of %d iterations over %d slices", iteration, slices, slices)
+        elif iteration == slices:
+            self.logger.info("Parareal ran all %d iterations (serial-equivalent, no speedup)", slices)
+        else:
+            self.logger.warning(
+                "Parareal stopped at max_iterations=%d without reaching tolerance %g; result is not converged",
+                iteration,
+                self._tolerance,
+            )
+        return times, rho
+
+    def benchmark(
+        self, controls: np.ndarray, t_max: float, steps: int, max_deviation: float | None = None
+    ) -> Dict[str, Any]:
+        """Runs the serial fine solver and Parareal on the same trajectory; reports timing and deviation.
+
+        With ``max_deviation`` set, a larger deviation from the serial ``LindbladSolver`` raises ``ValueError``.
+        """
+        start = time.perf_counter()
+        _, serial = self._fine.solve(controls, t_max, steps)
+        serial_s = time.perf_counter() - start
+        start = time.perf_counter()
+        _, parallel = self.solve(controls, t_max, steps)
+        parareal_s = time.perf_counter() - start
+        report = {
+            "slices": self._slices,
+            "workers": self._workers,
+            "iterations": self.last_iterations,
+            "converged": self.last_converged,
+            "serial_s": serial_s,
+            "parareal_s": parareal_s,
+            "speedup": serial_s / parareal_s if parareal_s > 0 else float("nan"),
+            "max_deviation": float(np.max(np.abs(parallel - serial))),
+        }
+        if max_deviation is not None and report["max_deviation"] > max_deviation:
+            self.logger.error(
+                "Parareal deviates from the serial solver by %.3e (tolerance %s)",
+                report["max_deviation"],
+                max_deviation,
+            )
+            raise ValueError(f"Parareal deviation {report['max_deviation']:.3e} exceeds tolerance {max_deviation}")
+        self.logger.info("Parareal benchmark %s", report)
+        return report
+
+    @staticmethod
+    def format(report: Dict[str, Any]) -> str:
+        return (
+            f"slices={report['slices']} workers={report['workers']} iterations={report['iterations']} "
+            f"converged={report['converged']} "
+            f"serial={report['serial_s']:.3f}s parareal={report['parareal_s']:.3f}s "
+            f"speedup={report['speedup']:.2f}x max_deviation={report['max_deviation']:.2e}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parareal vs serial Lindblad solve of one long trajectory")
+    parser.add_argument("--t-max", type=float, default=3000.0, help="Trajectory length")
+    parser.add_argument("--steps", type=int, default=200000, help="Output grid points")
+    parser.add_argument("--slices", type=int, default=8, help="Time slices")
+    parser.add_argument("--workers", type=int, default=4, help="Process pool size for the fine solves")
+    parser.add_argument("--rtol", type=float, default=1e-8, help="Fine solver relative tolerance")
+    args = parser.parse_args()
+    solver = PararealSolver(
+        Hamiltonian(drift=0.02),
+        LindbladOperators(t1=30.0, t2=20.0, tphi=0.01),
+        slices=args.slices,
+        workers=args.workers,
+        rtol=args.rtol,
+        atol=args.rtol * 1e-2,
+    )
+    print(PararealSolver.format(solver.benchmark(np.array([0.3, -0.2, 0.1]), args.t_max, args.steps)))
@@ -1,28 +1,102 @@
 from __future__ import annotations
 
 import numpy as np
-from typing import Callable
+from scipy.stats import qmc
+from typing import Callable, List
 
 from quantum_twin.core.BaseComponent import BaseComponent
 
 
 class PulseGenerator(BaseComponent):
-    """Generates randomized control pulses."""
+    """Generates randomized control pulses.
 
-    def __init__(self, scale: float = 0.5, seed: int | None = None) -> None:
+    ``sampler`` chooses how a batch of controls covers the cube ``[-scale, scale]^dim``: ``uniform`` draws
+    i.i.d. points, ``sobol`` a scrambled Sobol' sequence, ``lhs`` a Latin hypercube (one point per slab
+    along every axis) and ``stratified`` a jittered grid (at most one point per cell; Latin hypercube once
+    the grid exceeds ``MAX_STRATIFIED_CELLS``). The space-filling samplers leave no large gaps, so fewer
+    simulated trajectories cover the control space equally well.
+    """
+
+    SAMPLERS = ("uniform", "sobol", "lhs", "stratified")
+    # Largest jittered grid the stratified sampler indexes; larger grids fall back to ``lhs``.
+    MAX_STRATIFIED_CELLS = 2**40
+
+    def __init__(
+        self,
+        scale: float = 0.5,
+        seed: int | np.random.SeedSequence | None = None,
+        sampler: str = "uniform",
+    ) -> None:
         super().__init__()
+        if sampler not in self.SAMPLERS:
+            raise ValueError(f"Unknown sampler {sampler!r}; expected one of {self.SAMPLERS}")
         self._scale = scale
-        self._rng = np.random.default_rng(seed)
-        self.logger.info("PulseGenerator initialized scale=%.3f seed=%s", scale, seed)
+        self._sampler = sampler
+        self._seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self._rng = np.random.default_rng(self._seed_seq)
+        self.logger.info("PulseGenerator initialized scale=%.3f seed=%s sampler=%s", scale, seed, sampler)
+
+    @property
+    def sampler(self) -> str:
+        return self._sampler
 
     def sample_pulse(self) -> np.ndarray:
         pulse = self._rng.uniform(-self._scale, self._scale, size=(3,))
         self.logger.debug("Sampled pulse %s", pulse)
         return pulse
 
+    def _unit(self, count: int, dim: int) -> np.ndarray:
+        """``count`` points (count, dim) in the unit cube from the configured space-filling sampler."""
+        if self._sampler == "sobol":
+            # A prefix of a 2^m scrambled sequence; drawing 2^m points avoids SciPy's balance warning.
+            engine = qmc.Sobol(dim, scramble=True, rng=self._rng)
+            return engine.random_base2(int(np.ceil(np.log2(max(count, 1)))))[:count]
+        if self._sampler == "lhs":
+            return qmc.LatinHypercube(dim, rng=self._rng).random(count)
+        # Jittered grid: ``count`` distinct cells of an m^dim grid, one uniform point inside each.
+        per_axis = max(1, int(np.ceil(count ** (1.0 / dim))))
+        if per_axis**dim > self.MAX_STRATIFIED_CELLS:
+            # m^dim grows exponentially with multi-qubit control widths (3N) and would overflow int64.
+            self.logger.warning(
+                "Stratified grid of %d^%d cells exceeds %d; using Latin hypercube sampling instead",
+                per_axis,
+                dim,
+                self.MAX_STRATIFIED_CELLS,
+            )
+            return qmc.LatinHypercube(dim, rng=self._rng).random(count)
+        cells = self._rng.choice(per_axis**dim, size=count, replace=False)
+        corners = np.stack(np.unravel_index(cells, (per_axis,) * dim), axis=-1)
+        return (corners + self._rng.random((count, dim))) / per_axis
+
+    def sample_pulses(self, count: int, dim: int = 3) -> np.ndarray:
+        """Samples ``count`` control vectors in one call; returns shape (count, dim)."""
+        if self._sampler == "uniform":
+            return self._rng.uniform(-self._scale, self._scale, size=(count, dim))
+        return self._scale * (2.0 * self._unit(count, dim) - 1.0)
+
+    def refine(self, controls: np.ndarray, errors: np.ndarray, count: int, radius: float = 0.1) -> np.ndarray:
+        """Samples ``count`` controls (count, dim) concentrated where the surrogate error is high.
+
+        Centres are drawn from ``controls`` (B, dim) with probability proportional to ``errors`` (B,); each new
+        point is offset inside a box of half-width ``radius * scale`` with the configured sampler and clipped
+        to the control cube.
+        """
+        controls = np.asarray(controls, dtype=np.float64)
+        errors = np.clip(np.asarray(errors, dtype=np.float64).reshape(len(controls)), 0.0, None)
+        if not len(controls) or not np.isfinite(errors).all() or errors.sum() <= 0:
+            raise ValueError("refine requires finite errors with a positive sum")
+        centres = controls[self._rng.choice(len(controls), size=count, p=errors / errors.sum())]
+        offsets = radius * self.sample_pulses(count, controls.shape[-1])
+        self.logger.debug("Refined %d controls around %d candidates", count, len(controls))
+        return np.clip(centres + offsets, -self._scale, self._scale)
+
+    def spawn(self, count: int) -> List[PulseGenerator]:
+        """Independent child generators whose streams depend only on the seed and spawn order."""
+        children = self._seed_seq.spawn(count)
+        return [PulseGenerator(scale=self._scale, seed=child, sampler=self._sampler) for child in children]
+
     def sinusoidal(self, omega: float = 2.0 * np.pi) -> Callable[[np.ndarray], np.ndarray]:
         def fn(t: np.ndarray) -> np.ndarray:
             return self._scale * np.stack([np.sin(omega * t), np.cos(omega * t), np.zeros_like(t)], axis=-1)
 
         return fn
-
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+from scipy.linalg import expm
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.Liouvillian import Liouvillian
+
+Waveform = Callable[[np.ndarray], np.ndarray] | np.ndarray
+
+
+class PulseSequenceSolver(BaseComponent):
+    """Simulates time-dependent controls as piecewise-constant segments.
+
+    The state after segment ``k`` is ``P_k ... P_1 vec(rho0)`` with ``P_k = exp(L(c_k) dt_k)``. Segment
+    amplitudes and durations are quantized to ``amplitude_resolution``/``duration_resolution`` and the
+    propagators are kept in an LRU cache keyed by the quantized values, so segments that repeat within or
+    across pulses are exponentiated once. Misses of one call are computed in a single batched ``expm``.
+    """
+
+    def __init__(
+        self,
+        hamiltonian: Hamiltonian,
+        operators: LindbladOperators,
+        amplitude_resolution: float = 1e-6,
+        duration_resolution: float = 1e-9,
+        cache_size: int = 4096,
+    ) -> None:
+        super().__init__()
+        if amplitude_resolution <= 0 or duration_resolution <= 0:
+            raise ValueError("Quantization resolutions must be positive")
+        self._hamiltonian = hamiltonian
+        ops = [op.numpy() for op in operators.operators()]
+        self._ops = np.stack(ops) if ops else np.zeros((0, 2, 2), dtype=np.complex128)
+        self._no_ops = np.zeros((0, 2, 2), dtype=np.complex128)
+        self._amp_res = amplitude_resolution
+        self._dur_res = duration_resolution
+        self._cache_size = cache_size
+        self._cache: OrderedDict[Tuple[bool, int, int, int, int], np.ndarray] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self.logger.info(
+            "PulseSequenceSolver ready amplitude_resolution=%g duration_resolution=%g cache_size=%d",
+            amplitude_resolution,
+            duration_resolution,
+            cache_size,
+        )
+
+    @staticmethod
+    def discretize(waveform: Waveform, t_max: float, segments: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns segment durations (S,) and controls (S, 3).
+
+        Callables are sampled at segment midpoints of a uniform grid over ``[0, t_max]``; arrays are
+        taken as one value per segment. Scalar waveforms (shape (S,)) drive the x axis.
+        """
+        if callable(waveform):
+            edges = np.linspace(0.0, t_max, segments + 1)
+            values = np.asarray(waveform(0.5 * (edges[:-1] + edges[1:])), dtype=np.float64)
+        else:
+            values = np.asarray(waveform, dtype=np.float64)
+        if values.ndim == 1:
+            values = np.stack([values, np.zeros_like(values), np.zeros_like(values)], axis=-1)
+        if values.ndim != 2 or values.shape[-1] != 3:
+            raise ValueError(f"Waveform must have shape (S,) or (S, 3), got {values.shape}")
+        durations = np.full(values.shape[0], t_max / values.shape[0])
+        return durations, values
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._cache)}
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def segment_propagators(
+        self, controls: np.ndarray, durations: np.ndarray, use_lindblad: bool = True
+    ) -> np.ndarray:
+        """Propagators (S, 4, 4) for quantized segments, served from the cache where possible."""
+        amp_q = np.rint(np.asarray(controls, dtype=np.float64) / self._amp_res).astype(np.int64)
+        dur_q = np.rint(np.asarray(durations, dtype=np.float64) / self._dur_res).astype(np.int64)
+        keys = [(use_lindblad, *map(int, amp), int(dur)) for amp, dur in zip(amp_q, dur_q)]
+        found: Dict[Tuple[bool, int, int, int, int], np.ndarray] = {}
+        for key in keys:
+            if key in self._cache and key not in found:
+                self._cache.move_to_end(key)
+                found[key] = self._cache[key]
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        if missing:
+            miss = np.array([key[1:] for key in missing], dtype=np.float64)
+            h_mat = self._hamiltonian.build(miss[:, :3] * self._amp_res).numpy()
+            generators = Liouvillian.from_matrices(h_mat, self._ops if use_lindblad else self._no_ops)
+            propagators = expm(generators * (miss[:, 3] * self._dur_res)[:, None, None])
+            for key, propagator in zip(missing, propagators):
+                found[key] = propagator
+                self._cache[key] = propagator
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        self._misses += len(missing)
+        self._hits += len(keys) - len(missing)
+        return np.stack([found[key] for key in keys])
+
+    def solve(
+        self,
+        waveform: Waveform,
+        t_max: float,
+        segments: int = 100,
+        use_lindblad: bool = True,
+        rho0: np.ndarray | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns segment boundary times (S + 1,), segment controls (S, 3) and rho (S + 1, 2, 2)."""
+        durations, controls = self.discretize(waveform, t_max, segments)
+        propagators = self.segment_propagators(controls, durations, use_lindblad)
+        if rho0 is None:
+            rho0 = np.array([[1.0, 0.0], [0.0, 0.0]], dtype=np.complex128)
+        states = np.empty((len(propagators) + 1, 4), dtype=np.complex128)
+        states[0] = np.asarray(rho0, dtype=np.complex128).reshape(4)
+        for k, propagator in enumerate(propagators):
+            states[k + 1] = propagator @ states[k]
+        times = np.concatenate([[0.0], np.cumsum(durations)])
+        self.logger.debug("Pulse sequence of %d segments, cache %s", len(propagators), self.cache_info())
+        return times, controls, states.reshape(-1, 2, 2)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import numpy as np
+
+from quantum_twin.core.BaseComponent import BaseComponent
+
+
+class RHSKernel(BaseComponent):
+    """Linear ODE right-hand side dy/dt = J y precompiled for ``solve_ivp``.
+
+    The complex generator is converted once into a real Jacobian acting on the interleaved
+    real/imaginary layout produced by ``array.view(np.float64)``.
+    """
+
+    IMPLICIT_METHODS = ("BDF", "Radau", "LSODA")
+
+    def __init__(self, generator: np.ndarray) -> None:
+        super().__init__()
+        self._generator = np.asarray(generator, dtype=np.complex128)
+        self._jacobian = self.realify(self._generator)
+        self.logger.debug("RHSKernel compiled with state size %d", self._jacobian.shape[0])
+
+    @staticmethod
+    def realify(generator: np.ndarray) -> np.ndarray:
+        """Real matrix equivalent of a complex generator for interleaved (re, im) vectors."""
+        rotation = np.array([[0.0, -1.0], [1.0, 0.0]])
+        return np.kron(generator.real, np.eye(2)) + np.kron(generator.imag, rotation)
+
+    @property
+    def generator(self) -> np.ndarray:
+        return self._generator
+
+    def __call__(self, t: float, y: np.ndarray) -> np.ndarray:
+        return self._jacobian @ y
+
+    def jacobian(self, t: float, y: np.ndarray) -> np.ndarray:
+        return self._jacobian
+
+    def solve_ivp_kwargs(self, method: str) -> Dict[str, Any]:
+        """Extra ``solve_ivp`` arguments: the constant Jacobian for implicit methods."""
+        return {"jac": self.jacobian} if method in self.IMPLICIT_METHODS else {}
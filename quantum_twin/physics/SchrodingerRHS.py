@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import numpy as np
+
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.RHSKernel import RHSKernel
+
+
+class SchrodingerRHS(RHSKernel):
+    """Schrödinger RHS d psi/dt = -i H psi with H built once per solve."""
+
+    def __init__(self, hamiltonian: Hamiltonian, controls: np.ndarray) -> None:
+        h_mat = hamiltonian.build(np.broadcast_to(controls, (1, 3))).squeeze(0).numpy()
+        super().__init__(-1j * h_mat)
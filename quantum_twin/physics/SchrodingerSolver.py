@@ -5,30 +5,69 @@ from scipy.integrate import solve_ivp
 
 from quantum_twin.core.BaseComponent import BaseComponent
 from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.SchrodingerRHS import SchrodingerRHS
 
 
 class SchrodingerSolver(BaseComponent):
-    """Integrates the Schrödinger equation for pure states."""
+    """Integrates the Schrödinger equation for pure states.
 
-    def __init__(self, hamiltonian: Hamiltonian) -> None:
+    ``method`` is either a ``solve_ivp`` method name (default ``RK45``; ``BDF``/``Radau``/``LSODA`` receive
+    the constant Jacobian) or ``exact``, which evaluates the closed-form SU(2) propagator of the
+    constant Hamiltonian on the whole grid.
+    """
+
+    def __init__(
+        self, hamiltonian: Hamiltonian, rtol: float = 1e-3, atol: float = 1e-6, method: str = "RK45"
+    ) -> None:
         super().__init__()
         self._hamiltonian = hamiltonian
-        self.logger.info("SchrodingerSolver ready")
+        self._rtol = rtol
+        self._atol = atol
+        self._method = method
+        self.logger.info("SchrodingerSolver ready method=%s", method)
+
+    @property
+    def method(self) -> str:
+        return self._method
 
-    def solve(self, controls: np.ndarray, t_max: float, steps: int) -> tuple[np.ndarray, np.ndarray]:
+    def solve(
+        self, controls: np.ndarray, t_max: float, steps: int, method: str | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        method = method or self._method
+        if method == "exact":
+            times, density = self.solve_exact(controls, t_max, steps)
+            return times, density[0]
         psi0 = np.array([1.0 + 0j, 0.0 + 0j], dtype=np.complex128)
         times = np.linspace(0, t_max, steps)
-
-        def rhs(t: float, psi_real_imag: np.ndarray) -> np.ndarray:
-            psi = psi_real_imag.view(np.complex128)
-            h_mat = self._hamiltonian.build(
-                controls=np.broadcast_to(controls, (1, controls.shape[-1]))
-            ).squeeze(0)
-            dpsi = -1j * h_mat.numpy() @ psi
-            return dpsi.view(np.float64)
-
-        sol = solve_ivp(rhs, (0, t_max), psi0.view(np.float64), t_eval=times, method="RK45")
-        psi = sol.y.view(np.complex128).T
+        rhs = SchrodingerRHS(self._hamiltonian, controls)
+        sol = solve_ivp(
+            rhs,
+            (0, t_max),
+            psi0.view(np.float64),
+            t_eval=times,
+            method=method,
+            rtol=self._rtol,
+            atol=self._atol,
+            **rhs.solve_ivp_kwargs(method),
+        )
+        psi = np.ascontiguousarray(sol.y.T).view(np.complex128)
         density = np.einsum("bi,bj->bij", psi, np.conjugate(psi))
         return times, density
 
+    def solve_exact(self, controls: np.ndarray, t_max: float, steps: int) -> tuple[np.ndarray, np.ndarray]:
+        """Closed-form U(t) = cos(|h|t) I - i sin(|h|t) (ĥ·σ) applied to |0>.
+
+        Accepts controls of shape (3,) or (B, 3) and returns rho of shape (B, steps, 2, 2).
+        """
+        times = np.linspace(0, t_max, steps)
+        field = self._hamiltonian.field(np.atleast_2d(controls))[:, None, :]
+        norm = np.linalg.norm(field, axis=-1)
+        angle = norm * times[None, :]
+        # sin(|h|t) ĥ written as t·sinc(|h|t/π)·h so that a zero field needs no special case.
+        sin_axis = (times[None, :] * np.sinc(angle / np.pi))[..., None] * field
+        psi = np.stack(
+            [np.cos(angle) - 1j * sin_axis[..., 2], -1j * (sin_axis[..., 0] + 1j * sin_axis[..., 1])], axis=-1
+        )
+        density = np.einsum("bti,btj->btij", psi, np.conjugate(psi))
+        self.logger.debug("Exact SU(2) propagation for %d trajectories", density.shape[0])
+        return times, density
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Set
+
+import torch
+
+from quantum_twin.core.BaseComponent import BaseComponent
+
+
+class ShardedDatasetWriter(BaseComponent):
+    """Writes a dataset as fixed-size ``torch.save`` shards plus a JSON manifest.
+
+    Shards and the manifest are replaced atomically, so an interrupted run can resume from the
+    last completed shard as long as the generating config (and therefore its hash) is unchanged.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, directory: str | Path, config: Dict[str, Any], shard_size: int) -> None:
+        super().__init__()
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._config_hash = self.config_hash(config)
+        manifest_path = self._dir / self.MANIFEST
+        if manifest_path.exists():
+            self._manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if self._manifest.get("config_hash") != self._config_hash:
+                raise ValueError(
+                    f"Shard directory {self._dir} was written with a different config "
+                    f"({self._manifest.get('config_hash')} != {self._config_hash})"
+                )
+            self.logger.info("Resuming sharded dataset %s with %d shards", self._dir, len(self._manifest["shards"]))
+        else:
+            self._manifest = {
+                "config_hash": self._config_hash,
+                "config": config,
+                "shard_size": shard_size,
+                "dtypes": {},
+                "shards": [],
+                "complete": False,
+            }
+            self._write_manifest()
+            self.logger.info("Created sharded dataset %s shard_size=%d", self._dir, shard_size)
+
+    @staticmethod
+    def config_hash(config: Dict[str, Any]) -> str:
+        canonical = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _write_manifest(self) -> None:
+        tmp = self._dir / f"{self.MANIFEST}.tmp"
+        tmp.write_text(json.dumps(self._manifest, indent=2, default=str), encoding="utf-8")
+        os.replace(tmp, self._dir / self.MANIFEST)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self._dir / self.MANIFEST
+
+    def completed_shards(self) -> Set[int]:
+        return {int(shard["index"]) for shard in self._manifest["shards"]}
+
+    def write_shard(self, index: int, shard: Dict[str, torch.Tensor], trajectories: int) -> Path:
+        path = self._dir / f"shard_{index:05d}.pt"
+        tmp = path.with_suffix(".pt.tmp")
+        torch.save({name: tensor.cpu() for name, tensor in shard.items()}, tmp)
+        os.replace(tmp, path)
+        self._manifest["dtypes"] = {name: str(tensor.dtype).replace("torch.", "") for name, tensor in shard.items()}
+        self._manifest["shards"] = [s for s in self._manifest["shards"] if int(s["index"]) != index]
+        self._manifest["shards"].append(
+            {"index": index, "file": path.name, "trajectories": trajectories, "samples": int(shard["t"].shape[0])}
+        )
+        self._manifest["shards"].sort(key=lambda s: int(s["index"]))
+        self._write_manifest()
+        self.logger.info("Wrote shard %s (%d trajectories)", path, trajectories)
+        return path
+
+    def finalize(self) -> Path:
+        self._manifest["complete"] = True
+        self._write_manifest()
+        self.logger.info("Sharded dataset complete with %d shards", len(self._manifest["shards"]))
+        return self.manifest_path
+
+    @staticmethod
+    def is_sharded(path: str | Path) -> bool:
+        return (Path(path) / ShardedDatasetWriter.MANIFEST).exists()
+
+    @staticmethod
+    def read_manifest(directory: str | Path, allow_partial: bool = False) -> Dict[str, Any]:
+        """Reads the manifest; raises ``ValueError`` for an unfinished run unless ``allow_partial``."""
+        directory = Path(directory)
+        manifest = json.loads((directory / ShardedDatasetWriter.MANIFEST).read_text(encoding="utf-8"))
+        if not manifest.get("complete", False) and not allow_partial:
+            raise ValueError(
+                f"Sharded dataset {directory} is incomplete ({len(manifest['shards'])} shards written); "
+                "the generating run crashed or is still running. Pass allow_partial=True to read it anyway"
+            )
+        return manifest
+
+    @staticmethod
+    def iter_shards(
+        directory: str | Path, map_location: str = "cpu", allow_partial: bool = False
+    ) -> Iterator[Dict[str, torch.Tensor]]:
+        """Yields the shards in index order, one in memory at a time."""
+        directory = Path(directory)
+        for shard in ShardedDatasetWriter.read_manifest(directory, allow_partial)["shards"]:
+            yield torch.load(directory / shard["file"], map_location=map_location)
+
+    @staticmethod
+    def load(directory: str | Path, map_location: str = "cpu", allow_partial: bool = False) -> Dict[str, torch.Tensor]:
+        """Concatenates all shards listed in the manifest into one dataset dict (use ``iter_shards`` beyond RAM)."""
+        shards = list(ShardedDatasetWriter.iter_shards(directory, map_location, allow_partial))
+        if not shards:
+            raise ValueError(f"Sharded dataset {directory} has no shards")
+        return {name: torch.cat([shard[name] for shard in shards]) for name in shards[0]}
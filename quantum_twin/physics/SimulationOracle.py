@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import List, Tuple
+
+import numpy as np
+from scipy.linalg import expm
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.Liouvillian import Liouvillian
+
+
+class SimulationOracle(BaseComponent):
+    """Exact rho(t) at arbitrary times for constant controls, without integrating on a grid.
+
+    Each distinct control vector is decomposed once as ``L = V diag(lam) V^-1``; afterwards
+    ``vec(rho(t)) = V (exp(lam t) * V^-1 vec(rho0))`` costs O(1) per query time. Generators whose
+    eigenvector matrix is ill-conditioned (defective or nearly so, ``cond > cond_limit``) fall back to
+    one batched ``expm`` over that control's query times. At most ``max_entries`` decompositions are kept,
+    evicting the least recently queried control vector first.
+    """
+
+    def __init__(
+        self,
+        hamiltonian: Hamiltonian,
+        operators: LindbladOperators,
+        use_lindblad: bool = True,
+        rho0: np.ndarray | None = None,
+        cond_limit: float = 1e8,
+        max_entries: int = 4096,
+    ) -> None:
+        super().__init__()
+        self._hamiltonian = hamiltonian
+        ops = [op.numpy() for op in operators.operators()] if use_lindblad else []
+        self._ops = np.stack(ops) if ops else np.zeros((0, 2, 2), dtype=np.complex128)
+        if rho0 is None:
+            rho0 = np.array([[1.0, 0.0], [0.0, 0.0]], dtype=np.complex128)
+        self._rho0 = np.asarray(rho0, dtype=np.complex128).reshape(4)
+        self._cond_limit = cond_limit
+        self._max_entries = max_entries
+        # LRU: controls bytes -> (generator, eigenvalues, eigenvectors, coefficients) or generator only
+        self._decompositions: OrderedDict[bytes, Tuple[np.ndarray, ...]] = OrderedDict()
+        self.logger.info("SimulationOracle ready use_lindblad=%s max_entries=%d", use_lindblad, max_entries)
+
+    def _lookup(self, unique: np.ndarray) -> List[Tuple[np.ndarray, ...]]:
+        """Decompositions for distinct control rows (B, 3), decomposing unseen ones in one batch.
+
+        Eviction runs after the entries are collected, so a query with more than ``max_entries`` distinct
+        controls still succeeds.
+        """
+        new = [row for row in unique if row.tobytes() not in self._decompositions]
+        if new:
+            self._decompose(np.stack(new))
+        entries = []
+        for row in unique:
+            key = row.tobytes()
+            self._decompositions.move_to_end(key)
+            entries.append(self._decompositions[key])
+        while len(self._decompositions) > self._max_entries:
+            self._decompositions.popitem(last=False)
+        return entries
+
+    def prepare(self, controls: np.ndarray) -> None:
+        """Decomposes the generators of all not yet seen control vectors (B, 3) in one batch."""
+        self._lookup(np.unique(np.asarray(controls, dtype=np.float64).reshape(-1, 3), axis=0))
+
+    def _decompose(self, new: np.ndarray) -> None:
+        generators = Liouvillian.from_matrices(self._hamiltonian.build(new).numpy(), self._ops)
+        eigvals, eigvecs = np.linalg.eig(generators)
+        conds = np.linalg.cond(eigvecs)
+        for row, gen, lam, vecs, cond in zip(new, generators, eigvals, eigvecs, conds):
+            if cond > self._cond_limit:
+                self._decompositions[row.tobytes()] = (gen,)
+            else:
+                self._decompositions[row.tobytes()] = (gen, lam, vecs, np.linalg.solve(vecs, self._rho0))
+        self.logger.debug("Decomposed %d generators (%d cached)", len(new), len(self._decompositions))
+
+    def __call__(self, t: np.ndarray, controls: np.ndarray) -> np.ndarray:
+        """rho for query times ``t`` (...) and controls (..., 3), broadcast together; returns (..., 2, 2)."""
+        t = np.asarray(t, dtype=np.float64)
+        controls = np.asarray(controls, dtype=np.float64)
+        shape = np.broadcast_shapes(t.shape, controls.shape[:-1])
+        t = np.broadcast_to(t, shape).reshape(-1)
+        controls = np.broadcast_to(controls, shape + (3,)).reshape(-1, 3)
+        unique, inverse = np.unique(controls, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        entries = self._lookup(unique)
+        exact = np.array([len(entry) == 4 for entry in entries])
+        states = np.empty((len(t), 4), dtype=np.complex128)
+        if exact.any():
+            lam = np.stack([entry[1] if len(entry) == 4 else np.zeros(4, np.complex128) for entry in entries])
+            vecs = np.stack([entry[2] if len(entry) == 4 else np.eye(4, dtype=np.complex128) for entry in entries])
+            coeffs = np.stack([entry[3] if len(entry) == 4 else np.zeros(4, np.complex128) for entry in entries])
+            rows = exact[inverse]
+            group = inverse[rows]
+            weights = np.exp(lam[group] * t[rows][:, None]) * coeffs[group]
+            states[rows] = np.einsum("nij,nj->ni", vecs[group], weights)
+        for index in np.flatnonzero(~exact):
+            mask = inverse == index
+            generator = entries[index][0]
+            states[mask] = expm(generator * t[mask][:, None, None].astype(np.complex128)) @ self._rho0
+        return states.reshape(shape + (2, 2))
+
+    def trajectory(self, controls: np.ndarray, times: np.ndarray) -> np.ndarray:
+        """rho on a shared grid: controls (B, 3), times (T,) -> (B, T, 2, 2)."""
+        controls = np.asarray(controls, dtype=np.float64).reshape(-1, 3)
+        return self(np.asarray(times)[None, :], controls[:, None, :])
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+
+from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.physics.Hamiltonian import Hamiltonian
+from quantum_twin.physics.LindbladOperators import LindbladOperators
+from quantum_twin.physics.Liouvillian import Liouvillian
+
+
+class SteadyStateSolver(BaseComponent):
+    """Long-time state rho_ss with L vec(rho_ss) = 0, without integrating the master equation.
+
+    Controls and the noise parameters (drift, t1, t2, tphi) broadcast together, so a whole scan is one
+    batch of 4x4 Liouvillians. The null vector is the right singular vector of the smallest singular
+    value, normalized to unit trace. Parameter sets whose null space is not one-dimensional (for example
+    no dissipation at all) have no unique steady state and return NaN.
+    """
+
+    def __init__(
+        self, hamiltonian: Hamiltonian, operators: LindbladOperators, degeneracy_tolerance: float = 1e-10
+    ) -> None:
+        super().__init__()
+        self._hamiltonian = hamiltonian
+        self._operators = operators
+        self._basis = LindbladOperators.basis().numpy()
+        self._degeneracy_tolerance = degeneracy_tolerance
+        self.logger.info("SteadyStateSolver ready degeneracy_tolerance=%s", degeneracy_tolerance)
+
+    def generators(
+        self,
+        controls: np.ndarray,
+        drift: np.ndarray | float | None = None,
+        t1: np.ndarray | float | None = None,
+        t2: np.ndarray | float | None = None,
+        tphi: np.ndarray | float | None = None,
+    ) -> np.ndarray:
+        """Liouvillians (..., 4, 4) for controls (..., 3) and broadcastable noise parameters.
+
+        Parameters left as ``None`` take the values of the configured ``Hamiltonian``/``LindbladOperators``.
+        """
+        controls = np.asarray(controls, dtype=np.float64)
+        drift = np.asarray(self._hamiltonian.drift if drift is None else drift, dtype=np.float64)
+        rates = self._operators.rates(t1, t2, tphi).numpy()
+        shape = np.broadcast_shapes(controls.shape[:-1], drift.shape, rates.shape[:-1])
+        # Hamiltonian.build adds the configured drift, so only the difference goes into c_z.
+        shifted = np.broadcast_to(controls, shape + (3,)).copy()
+        shifted[..., 2] += np.broadcast_to(drift, shape) - self._hamiltonian.drift
+        h_mat = self._hamiltonian.build(shifted).numpy()
+        ops = np.sqrt(np.broadcast_to(rates, shape + (3,)))[..., None, None] * self._basis
+        return Liouvillian.from_matrices(h_mat, ops)
+
+    def solve(
+        self,
+        controls: np.ndarray,
+        drift: np.ndarray | float | None = None,
+        t1: np.ndarray | float | None = None,
+        t2: np.ndarray | float | None = None,
+        tphi: np.ndarray | float | None = None,
+    ) -> np.ndarray:
+        """Steady states (..., 2, 2) over the broadcast shape of controls (..., 3) and noise parameters."""
+        generators = self.generators(controls, drift, t1, t2, tphi)
+        _, singular, vh = np.linalg.svd(generators)
+        rho = vh[..., -1, :].conj().reshape(generators.shape[:-2] + (2, 2))
+        degenerate = singular[..., -2] <= self._degeneracy_tolerance * singular[..., 0]
+        trace = np.where(degenerate, 1.0, rho[..., 0, 0] + rho[..., 1, 1])
+        rho = rho / trace[..., None, None]
+        rho = 0.5 * (rho + rho.conj().swapaxes(-1, -2))
+        if degenerate.any():
+            self.logger.warning(
+                "%d of %d parameter sets have no unique steady state", degenerate.sum(), degenerate.size
+            )
+            rho[degenerate] = np.nan
+        self.logger.debug("Solved %d steady states", degenerate.size)
+        return rho
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import argparse
+from typing import Dict, List, Tuple
 
 from quantum_twin.core.BaseComponent import BaseComponent
 from quantum_twin.core.ConfigLoader import ConfigLoader, ConfigStep
 from quantum_twin.core.StepInstantiator import StepInstantiator
+from quantum_twin.metrics.MetricBase import MetricBase
 from quantum_twin.metrics.MetricsFactory import MetricsFactory
+from quantum_twin.physics.ShardedDatasetWriter import ShardedDatasetWriter
 
 
 class SimulationApplication(BaseComponent):
@@ -21,15 +24,46 @@ class SimulationApplication(BaseComponent):
         self._instantiator = StepInstantiator()
         self.logger.info("SimulationApplication loaded %s", config_path)
 
+    @staticmethod
+    def _shard_metrics(metrics: List[MetricBase], shard_dir: str) -> Tuple[Dict[str, float], int]:
+        """Metrics over a sharded dataset, one shard in memory at a time.
+
+        Per-shard values are combined weighted by sample count; ``min_*`` values take the minimum.
+        """
+        values: Dict[str, float] = {}
+        samples = 0
+        for shard in ShardedDatasetWriter.iter_shards(shard_dir):
+            count = len(shard["t"])
+            for metric in metrics:
+                for name, value in metric(shard["rho"], shard["rho"]).items():
+                    if name.startswith("min_"):
+                        values[name] = min(values.get(name, value), value)
+                    else:
+                        values[name] = values.get(name, 0.0) + value * count
+            samples += count
+        for name in values:
+            if not name.startswith("min_"):
+                values[name] /= max(samples, 1)
+        return values, samples
+
     def run(self) -> None:
         simulator = self._instantiator.instantiate(self._steps["simulator"])
         export_params = self._steps["export"].params
         trajectories = int(export_params.get("trajectories", 4))
         use_lindblad = bool(export_params.get("use_lindblad", True))
-        data = simulator.generate_dataset(trajectories=trajectories, use_lindblad=use_lindblad)
-
         metrics_factory = self._instantiator.instantiate(self._steps["metrics"])
         metrics = metrics_factory.build()
+        shard_dir = self._steps["simulator"].params.get("shard_dir")
+        if shard_dir:
+            manifest = simulator.stream_dataset(trajectories=trajectories, use_lindblad=use_lindblad)
+            self.logger.info("Simulation streamed to %s", manifest)
+            values, samples = self._shard_metrics(metrics, shard_dir)
+            for name, value in values.items():
+                self.logger.info("Simulation metric %s", {name: value})
+            self.logger.info("Simulation completed with %d samples", samples)
+            return
+        data = simulator.generate_dataset(trajectories=trajectories, use_lindblad=use_lindblad)
+
         for metric in metrics:
             values = metric(data["rho"], data["rho"])
             self.logger.info("Simulation metric %s", values)
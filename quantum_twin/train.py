@@ -38,11 +38,12 @@ class TrainingApplication(BaseComponent):
         model = model_factory.build()
         loss_fn = loss_factory.build()
         metrics = metrics_factory.build()
+        param = next(model.parameters())
 
         return {
             "model": model,
             "loss_fn": loss_fn,
-            "loader": dataloader.loader(),
+            "loader": dataloader.loader(dtype=param.dtype, device=param.device),
             "metrics": metrics,
             "training_params": training_params_step,
         }
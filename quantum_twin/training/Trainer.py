@@ -7,6 +7,7 @@ import torch
 from quantum_twin.core.BaseComponent import BaseComponent
 from quantum_twin.core.Constants import DEFAULT_ONNX_PATH
 from quantum_twin.deployment.ONNXExporter import ONNXExporter
+from quantum_twin.losses.PhysicsLoss import PhysicsLoss
 from quantum_twin.metrics.MetricBase import MetricBase
 from quantum_twin.training.CheckpointManager import CheckpointManager
 from quantum_twin.training.SchedulerFactory import SchedulerFactory
@@ -19,7 +20,7 @@ class Trainer(BaseComponent):
     def __init__(
         self,
         model: torch.nn.Module,
-        loss_fn: torch.nn.Module,
+        loss_fn: PhysicsLoss,
         dataloader: Iterable[Tuple[torch.Tensor, ...]],
         metrics: List[MetricBase],
         training_params: Dict[str, float],
@@ -47,13 +48,24 @@ class Trainer(BaseComponent):
             opset=int(self.params.get("onnx_opset", 17)),
         )
 
-    def _compute_losses(self, batch: Tuple[torch.Tensor, ...]) -> Dict[str, torch.Tensor]:
-        t, controls, rho_true = batch
-        rho_pred = self.model(t, controls)
-        data_loss = torch.mean(torch.abs(rho_pred - rho_true) ** 2)
-        physics_loss = self.loss_fn.compute(self.model, {"t": t, "controls": controls})
+    def _compute_losses(self, batch: Tuple[torch.Tensor, ...]) -> Tuple[Dict[str, torch.Tensor], torch.Tensor]:
+        """Losses and the prediction rho_pred from a single forward pass over the batch.
+
+        The physics loss' ``time_derivative`` returns rho_pred alongside d rho / dt, and the data, physics and
+        regularization terms all consume that tensor, so they share one autograd graph. Batches may carry
+        per-sample weights (multi-fidelity tiers) as a fourth element.
+        """
+        t, controls, rho_true = batch[:3]
+        rho_pred, drho_dt = self.loss_fn.time_derivative(self.model, t, controls)
+        error = torch.abs(rho_pred - rho_true) ** 2
+        if len(batch) > 3:
+            weight = batch[3]
+            data_loss = torch.sum(weight * error.mean(dim=(-2, -1))) / torch.sum(weight).clamp_min(1e-12)
+        else:
+            data_loss = torch.mean(error)
+        physics_loss = self.loss_fn.compute_from_states(rho_pred, drho_dt, controls)
         total_loss = data_loss + physics_loss
-        return {"total": total_loss, "data": data_loss, "physics": physics_loss}
+        return {"total": total_loss, "data": data_loss, "physics": physics_loss}, rho_pred
 
     def _log_metrics(self, step: int, rho_pred: torch.Tensor, rho_true: torch.Tensor) -> None:
         for metric in self.metrics:
@@ -70,13 +82,14 @@ class Trainer(BaseComponent):
         complex_dtype = torch.cfloat if param_dtype == torch.float32 else torch.cdouble
 
         for step, batch in zip(range(steps), self.dataloader):
-            t, controls, rho_true = batch
+            t, controls, rho_true = batch[:3]
             t = t.to(device=param_device, dtype=param_dtype)
             controls = controls.to(device=param_device, dtype=param_dtype)
             rho_true = rho_true.to(device=param_device, dtype=complex_dtype)
+            weights = tuple(weight.to(device=param_device, dtype=param_dtype) for weight in batch[3:])
 
             self.optimizer.zero_grad()
-            losses = self._compute_losses((t, controls, rho_true))
+            losses, rho_pred = self._compute_losses((t, controls, rho_true, *weights))
             losses["total"].backward()
             self.optimizer.step()
             if self.scheduler:
@@ -98,7 +111,7 @@ class Trainer(BaseComponent):
                         "loss/physics": float(losses["physics"].item()),
                     },
                 )
-                self._log_metrics(step, self.model(t, controls), rho_true)
+                self._log_metrics(step, rho_pred.detach(), rho_true)
 
             if step % ckpt_interval == 0 and step > 0:
                 self.checkpoints.save(step, self.model, self.optimizer)
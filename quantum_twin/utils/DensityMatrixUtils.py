@@ -3,6 +3,7 @@ from __future__ import annotations
 import torch
 
 from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.utils.Hermitian2x2 import Hermitian2x2
 from quantum_twin.utils.MathUtils import MathUtils
 
 
@@ -20,6 +21,8 @@ class DensityMatrixUtils(BaseComponent):
 
     @staticmethod
     def fidelity(rho: torch.Tensor, sigma: torch.Tensor) -> torch.Tensor:
+        if rho.shape[-1] == 2:
+            return Hermitian2x2.fidelity(rho, sigma)
         evals, evecs = torch.linalg.eigh(rho)
         real_evals = torch.clamp(evals.real, min=0.0)
         sqrt_diag = torch.diag_embed(torch.sqrt(real_evals)).to(evecs.dtype)
@@ -28,3 +31,23 @@ class DensityMatrixUtils(BaseComponent):
         evals_inner = torch.linalg.eigvals(inner)
         evals_inner_real = torch.clamp(torch.real(evals_inner), min=0.0)
         return torch.sum(torch.sqrt(evals_inner_real), dim=-1)
+
+    @staticmethod
+    def trace_distance(rho: torch.Tensor, sigma: torch.Tensor) -> torch.Tensor:
+        """0.5 tr|rho - sigma| per state (...,)."""
+        if rho.shape[-1] == 2:
+            return Hermitian2x2.trace_distance(rho, sigma)
+        return 0.5 * torch.sum(torch.abs(torch.linalg.eigvals(rho - sigma)), dim=-1)
+
+    @staticmethod
+    def partial_trace(rho: torch.Tensor, keep: list[int], num_qubits: int) -> torch.Tensor:
+        """Reduced state (..., 2^k, 2^k) of the qubits in ``keep`` (qubit 0 is the leftmost factor)."""
+        batch = rho.shape[:-2]
+        traced = [q for q in range(num_qubits) if q not in keep]
+        tensor = rho.reshape(batch + (2,) * (2 * num_qubits))
+        offset = len(batch)
+        for removed, qubit in enumerate(sorted(traced, reverse=True)):
+            remaining = num_qubits - removed
+            tensor = torch.diagonal(tensor, dim1=offset + qubit, dim2=offset + remaining + qubit).sum(-1)
+        side = 2 ** len(keep)
+        return tensor.reshape(batch + (side, side))
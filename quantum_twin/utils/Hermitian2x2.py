@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import torch
+
+from quantum_twin.core.BaseComponent import BaseComponent
+
+
+class Hermitian2x2(BaseComponent):
+    """Closed-form batched kernels for Hermitian (..., 2, 2) matrices (single-qubit states).
+
+    A Hermitian 2x2 matrix is m I + r . sigma with eigenvalues m -+ |r|, where m = tr / 2 and
+    |r|^2 = (tr / 2)^2 - det = ((a - d) / 2)^2 + |b|^2; the last form avoids the cancellation of the
+    trace-determinant one. Every kernel is a handful of elementwise ops, so it avoids LAPACK dispatch on tiny
+    matrices and stays differentiable in forward and reverse mode. Square roots go through ``_sqrt``, whose
+    gradient is 0 instead of NaN at 0 (degenerate eigenvalues, pure states).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.logger.info("Hermitian2x2 ready")
+
+    @staticmethod
+    def _sqrt(value: torch.Tensor) -> torch.Tensor:
+        positive = value > 0
+        return torch.where(positive, torch.sqrt(torch.where(positive, value, torch.ones_like(value))), 0.0)
+
+    @staticmethod
+    def _mean_radius(matrix: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        diag_a = matrix[..., 0, 0].real
+        diag_d = matrix[..., 1, 1].real
+        off = matrix[..., 0, 1]
+        radius_sq = (0.5 * (diag_a - diag_d)) ** 2 + off.real**2 + off.imag**2
+        return 0.5 * (diag_a + diag_d), Hermitian2x2._sqrt(radius_sq)
+
+    @staticmethod
+    def eigvalsh(matrix: torch.Tensor) -> torch.Tensor:
+        """Real eigenvalues (..., 2) in ascending order."""
+        mean, radius = Hermitian2x2._mean_radius(matrix)
+        return torch.stack([mean - radius, mean + radius], dim=-1)
+
+    @staticmethod
+    def clamp_psd(matrix: torch.Tensor, floor: float = 0.0) -> torch.Tensor:
+        """Clamps the eigenvalues from below at ``floor`` (the PSD projection for ``floor=0``).
+
+        The result is m' I + s (M - m I), where m' and s = (lambda'_+ - lambda'_-) / (2 |r|) come from the
+        clamped eigenvalues; s = 1 when nothing is clamped. No eigenvectors are formed, so forward-mode
+        tangents stay differentiable in reverse mode, which PyTorch does not support through ``eigh``.
+        """
+        mean, radius = Hermitian2x2._mean_radius(matrix)
+        lower = torch.clamp(mean - radius, min=floor)
+        upper = torch.clamp(mean + radius, min=floor)
+        split = radius > 0
+        scale = torch.where(split, (upper - lower) / torch.where(split, 2.0 * radius, torch.ones_like(radius)), 1.0)
+        eye = torch.eye(2, dtype=matrix.dtype, device=matrix.device)
+        shifted = matrix - mean[..., None, None].to(matrix.dtype) * eye
+        return (0.5 * (upper + lower))[..., None, None].to(matrix.dtype) * eye + scale[..., None, None] * shifted
+
+    @staticmethod
+    def sqrtm(matrix: torch.Tensor) -> torch.Tensor:
+        """Principal square root of PSD matrices: (M + sqrt(det) I) / sqrt(tr + 2 sqrt(det))."""
+        mean, radius = Hermitian2x2._mean_radius(matrix)
+        root_det = Hermitian2x2._sqrt((mean - radius) * (mean + radius))
+        norm = Hermitian2x2._sqrt(2.0 * mean + 2.0 * root_det)
+        eye = torch.eye(2, dtype=matrix.dtype, device=matrix.device)
+        shifted = matrix + root_det[..., None, None].to(matrix.dtype) * eye
+        inverse = torch.where(norm > 0, 1.0 / torch.where(norm > 0, norm, torch.ones_like(norm)), 0.0)
+        return shifted * inverse[..., None, None]
+
+    @staticmethod
+    def fidelity(rho: torch.Tensor, sigma: torch.Tensor) -> torch.Tensor:
+        """Root fidelity tr sqrt(sqrt(rho) sigma sqrt(rho)) = sqrt(tr(rho sigma) + 2 sqrt(det rho det sigma)).
+
+        The inner matrix has trace tr(rho sigma) and determinant det(rho) det(sigma), so the sum of the square
+        roots of its two eigenvalues needs no matrix square root. ``rho`` is first clamped to its PSD part, as
+        the general path does.
+        """
+        rho = Hermitian2x2.clamp_psd(rho)
+        overlap = torch.einsum("...ij,...ji->...", rho, sigma).real
+        mean_rho, radius_rho = Hermitian2x2._mean_radius(rho)
+        mean_sigma, radius_sigma = Hermitian2x2._mean_radius(sigma)
+        det_product = (mean_rho**2 - radius_rho**2) * (mean_sigma**2 - radius_sigma**2)
+        return Hermitian2x2._sqrt(overlap + 2.0 * Hermitian2x2._sqrt(det_product))
+
+    @staticmethod
+    def trace_distance(rho: torch.Tensor, sigma: torch.Tensor) -> torch.Tensor:
+        """0.5 tr|rho - sigma| = max(|m|, |r|) of the difference; |r| = half the Bloch-vector distance."""
+        mean, radius = Hermitian2x2._mean_radius(rho - sigma)
+        return torch.maximum(mean.abs(), radius)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import torch
 
 from quantum_twin.core.BaseComponent import BaseComponent
+from quantum_twin.utils.Hermitian2x2 import Hermitian2x2
 
 
 class MathUtils(BaseComponent):
@@ -24,7 +25,16 @@ class MathUtils(BaseComponent):
 
     @staticmethod
     def enforce_psd(matrix: torch.Tensor) -> torch.Tensor:
+        if matrix.shape[-1] == 2:
+            return MathUtils.enforce_trace_one(Hermitian2x2.clamp_psd(matrix, 1e-8))
         evals, evecs = torch.linalg.eigh(matrix)
         clipped = torch.clamp(evals.real, min=1e-8).to(evecs.dtype)
         psd = evecs @ torch.diag_embed(clipped) @ evecs.conj().transpose(-1, -2)
         return MathUtils.enforce_trace_one(psd)
+
+    @staticmethod
+    def eigvalsh(matrix: torch.Tensor) -> torch.Tensor:
+        """Ascending real eigenvalues (..., d) of Hermitian matrices; closed form for d = 2."""
+        if matrix.shape[-1] == 2:
+            return Hermitian2x2.eigvalsh(matrix)
+        return torch.linalg.eigvalsh(matrix)
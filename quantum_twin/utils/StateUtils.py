@@ -21,3 +21,18 @@ class StateUtils(BaseComponent):
         side = int(vec.shape[-1] ** 0.5)
         return vec.view(vec.shape[0], side, side)
 
+    @staticmethod
+    def density_to_bloch(rho: torch.Tensor) -> torch.Tensor:
+        """Bloch vector (..., 3) of Hermitian unit-trace qubit states (..., 2, 2)."""
+        x = 2.0 * torch.real(rho[..., 1, 0])
+        y = 2.0 * torch.imag(rho[..., 1, 0])
+        z = torch.real(rho[..., 0, 0] - rho[..., 1, 1])
+        return torch.stack([x, y, z], dim=-1)
+
+    @staticmethod
+    def bloch_to_density(bloch: torch.Tensor) -> torch.Tensor:
+        """Density matrices (I + r·σ) / 2 of shape (..., 2, 2) from Bloch vectors (..., 3)."""
+        complex_dtype = torch.cfloat if bloch.dtype == torch.float32 else torch.cdouble
+        x, y, z = bloch.to(complex_dtype).unbind(-1)
+        rows = [torch.stack([1.0 + z, x - 1j * y], dim=-1), torch.stack([x + 1j * y, 1.0 - z], dim=-1)]
+        return 0.5 * torch.stack(rows, dim=-2)